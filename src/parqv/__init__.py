@@ -2,30 +2,38 @@
 parqv - A Textual application for visualizing Parquet and JSON files.
 """
 
-from .app import ParqV
-from .cli import run_app
-from .core import (
-    SUPPORTED_EXTENSIONS, 
-    DEFAULT_PREVIEW_ROWS,
-    FileValidationError, 
-    validate_and_detect_file,
-    HandlerFactory, 
-    HandlerCreationError,
-    setup_logging, 
-    get_logger
-)
+from importlib import import_module
 
 __version__ = "1.0.0"
 
-__all__ = [
-    "ParqV",
-    "run_app", 
-    "SUPPORTED_EXTENSIONS",
-    "DEFAULT_PREVIEW_ROWS",
-    "FileValidationError",
-    "validate_and_detect_file",
-    "HandlerFactory",
-    "HandlerCreationError",
-    "setup_logging",
-    "get_logger",
-]
+# Public names resolved lazily (PEP 562) so `import parqv` doesn't drag in
+# Textual/pandas just to read __version__; each name is imported on first
+# access and cached in the module globals.
+_LAZY_EXPORTS = {
+    "ParqV": ("parqv.app", "ParqV"),
+    "run_app": ("parqv.cli", "run_app"),
+    "SUPPORTED_EXTENSIONS": ("parqv.core", "SUPPORTED_EXTENSIONS"),
+    "DEFAULT_PREVIEW_ROWS": ("parqv.core", "DEFAULT_PREVIEW_ROWS"),
+    "FileValidationError": ("parqv.core", "FileValidationError"),
+    "validate_and_detect_file": ("parqv.core", "validate_and_detect_file"),
+    "HandlerFactory": ("parqv.core", "HandlerFactory"),
+    "HandlerCreationError": ("parqv.core", "HandlerCreationError"),
+    "setup_logging": ("parqv.core", "setup_logging"),
+    "get_logger": ("parqv.core", "get_logger"),
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str):
+    try:
+        module_path, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_path), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
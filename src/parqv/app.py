@@ -5,13 +5,22 @@ from textual.app import App, ComposeResult, Binding
 from textual.containers import Container
 from textual.widgets import Header, Footer, Static, Label, TabbedContent, TabPane
 
-from .core import CSS_PATH, FileValidationError, validate_and_detect_file, HandlerFactory, HandlerCreationError, get_logger
+from .core import (
+    CSS_PATH,
+    FileValidationError,
+    validate_and_detect_file,
+    HandlerFactory,
+    HandlerCreationError,
+    get_lazy_logger,
+    shutdown_logging,
+)
 from .data_sources import DataHandler
+from .views.components import LoadingDisplay
 from .views.data_view import DataView
 from .views.metadata_view import MetadataView
 from .views.schema_view import SchemaView
 
-log = get_logger(__name__)
+log = get_lazy_logger(__name__)
 
 
 class ParqV(App[None]):
@@ -22,87 +31,166 @@ class ParqV(App[None]):
         Binding("q", "quit", "Quit", priority=True),
     ]
 
-    def __init__(self, file_path_str: Optional[str] = None, *args, **kwargs):
+    def __init__(
+            self,
+            file_path_str: Optional[str] = None,
+            *args,
+            file_path: Optional[Path] = None,
+            handler_type: Optional[str] = None,
+            file_size: Optional[int] = None,
+            **kwargs,
+    ):
         """
         Initialize the ParqV application.
-        
+
         Args:
-            file_path_str: Path to the file to visualize
+            file_path_str: Path to the file to visualize (validated on load)
+            file_path: Pre-validated Path to the file, as returned by
+                validate_and_detect_file; skips re-validation on load
+            handler_type: Detected handler type matching file_path
+            file_size: File size in bytes from the validation stat
             *args, **kwargs: Additional arguments for the Textual App
+
+        Note:
+            The file handler is constructed on a background worker after
+            mount, so the first paint isn't blocked on file parsing.
         """
         super().__init__(*args, **kwargs)
-        
+
         # Application state
         self.file_path: Optional[Path] = None
         self.handler: Optional[DataHandler] = None
         self.handler_type: Optional[str] = None
         self.error_message: Optional[str] = None
-        
-        # Initialize with file if provided
-        if file_path_str:
-            self._initialize_file_handler(file_path_str)
 
-    def _initialize_file_handler(self, file_path_str: str) -> None:
+        # File to load once the app is mounted; prefer the pre-validated
+        # (path, type, size) triple so validation isn't repeated here.
+        # Main tab layout, built once on the first successful load and
+        # reused (remount) if the handler is ever reloaded — each view owns
+        # a full widget tree that is expensive to re-allocate.
+        self._main_tabs: Optional[TabbedContent] = None
+
+        self._validated_file: Optional[tuple] = None
+        if file_path is not None and handler_type is not None:
+            self._validated_file = (file_path, handler_type, file_size)
+            self._pending_file_path: Optional[str] = str(file_path)
+        else:
+            self._pending_file_path = file_path_str
+
+    def _load_handler(self) -> None:
         """
-        Initialize the file handler for the given file path.
-        
-        Args:
-            file_path_str: Path to the file to process
+        Validate the pending file and construct its handler.
+
+        Runs on a worker thread so pyarrow/duckdb parsing overlaps with the
+        initial screen paint; results are handed back to the UI thread.
         """
         try:
-            # Validate file and detect type
-            self.file_path, self.handler_type = validate_and_detect_file(file_path_str)
-            
+            if self._validated_file is not None:
+                # Already validated by the caller (e.g. cli.run_app)
+                file_path, handler_type, file_size = self._validated_file
+            else:
+                # Validate file and detect type (stat result is reused by the handler)
+                file_path, handler_type, file_stat = validate_and_detect_file(
+                    self._pending_file_path
+                )
+                file_size = file_stat.st_size
+
             # Create appropriate handler
-            self.handler = HandlerFactory.create_handler(self.file_path, self.handler_type)
-            
-            log.info(f"Successfully initialized {self.handler_type} handler for: {self.file_path.name}")
-            
+            handler = HandlerFactory.create_handler(
+                file_path, handler_type, file_size=file_size
+            )
+
         except (FileValidationError, HandlerCreationError) as e:
-            self.error_message = str(e)
-            log.error(f"Failed to initialize handler: {e}")
-            
+            log.error("Failed to initialize handler: %s", e)
+            self.call_from_thread(self._on_load_error, str(e))
+            return
+
         except Exception as e:
-            self.error_message = f"An unexpected error occurred: {e}"
             log.exception("Unexpected error during handler initialization")
+            self.call_from_thread(self._on_load_error, f"An unexpected error occurred: {e}")
+            return
+
+        log.info("Successfully initialized %s handler for: %s", handler_type, file_path.name)
+        self.call_from_thread(self._on_handler_ready, file_path, handler_type, handler)
+
+    async def _on_handler_ready(
+            self, file_path: Path, handler_type: str, handler: DataHandler
+    ) -> None:
+        """Swap the loading placeholder for the main tabbed layout."""
+        self.file_path = file_path
+        self.handler_type = handler_type
+        self.handler = handler
+        self._update_header()
+
+        try:
+            await self.query_one("#loading-container").remove()
+            if self._main_tabs is None:
+                # Hand the panes to TabbedContent before mounting (the same way
+                # the `with TabbedContent():` compose idiom does), so they are
+                # composed atomically with the tab bar.
+                tabs = TabbedContent(id="main-tabs")
+                tabs.compose_add_child(TabPane("Metadata", MetadataView(id="metadata-view"), id="tab-metadata"))
+                tabs.compose_add_child(TabPane("Schema", SchemaView(id="schema-view"), id="tab-schema"))
+                tabs.compose_add_child(TabPane("Data Preview", DataView(id="data-view"), id="tab-data"))
+                self._main_tabs = tabs
+            if not self._main_tabs.is_attached:
+                await self.mount(self._main_tabs, before=self.query_one(Footer))
+        except Exception as e:
+            log.exception("Failed to mount main layout")
+            await self._on_load_error(f"Failed to display file: {e}")
+
+    async def _on_load_error(self, message: str) -> None:
+        """Replace the loading placeholder with an error display."""
+        self.error_message = message
+        self._update_header()
+
+        try:
+            await self.query_one("#loading-container").remove()
+        except Exception:
+            pass
+
+        await self.mount(
+            Container(
+                Label("Error Loading File:", classes="error-title"),
+                Static(message, classes="error-content"),
+                id="error-container"
+            ),
+            before=self.query_one(Footer),
+        )
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
         yield Header()
-        
-        if self.error_message:
-            log.debug(f"Displaying error message: {self.error_message}")
+
+        if self._pending_file_path:
+            display_name = Path(self._pending_file_path).name
             yield Container(
-                Label("Error Loading File:", classes="error-title"),
-                Static(self.error_message, classes="error-content"),
-                id="error-container"
+                LoadingDisplay(message=f"Loading {display_name}..."),
+                id="loading-container"
             )
-        elif self.handler:
-            log.debug(f"Composing main layout with TabbedContent for {self.handler_type} handler.")
-            with TabbedContent(id="main-tabs"):
-                yield TabPane("Metadata", MetadataView(id="metadata-view"), id="tab-metadata")
-                yield TabPane("Schema", SchemaView(id="schema-view"), id="tab-schema")
-                yield TabPane("Data Preview", DataView(id="data-view"), id="tab-data")
         else:
-            log.warning("No handler available and no error message set")
+            log.warning("No file path provided to ParqV")
             yield Container(
                 Label("No file loaded.", classes="error-title"),
                 Static("Please provide a valid file path.", classes="error-content"),
                 id="no-file-container"
             )
-            
+
         yield Footer()
 
     def on_mount(self) -> None:
-        """Handle app mount event - set up header information."""
+        """Handle app mount event - set up header and kick off file loading."""
         log.debug("App mounted.")
         self._update_header()
 
+        if self._pending_file_path and not self.handler:
+            self.run_worker(self._load_handler, thread=True, exclusive=True)
+
     def _update_header(self) -> None:
         """Update the header with file and format information."""
         try:
             header = self.query_one(Header)
-            
+
             if self.handler and self.file_path and self.handler_type:
                 display_name = self.file_path.name
                 format_name = self.handler_type.capitalize()
@@ -111,12 +199,15 @@ class ParqV(App[None]):
             elif self.error_message:
                 header.title = "parqv - Error"
                 header.sub_title = "Failed to load file"
+            elif self._pending_file_path:
+                header.title = f"parqv - {Path(self._pending_file_path).name}"
+                header.sub_title = "Loading..."
             else:
                 header.title = "parqv"
                 header.sub_title = "File Viewer"
-                
+
         except Exception as e:
-            log.error(f"Failed to update header: {e}")
+            log.error("Failed to update header: %s", e)
 
     def action_quit(self) -> None:
         """Handle quit action - cleanup and exit."""
@@ -131,14 +222,17 @@ class ParqV(App[None]):
                 self.handler.close()
                 log.info("Handler closed successfully.")
             except Exception as e:
-                log.error(f"Error during handler cleanup: {e}")
+                log.error("Error during handler cleanup: %s", e)
+
+        # Flush and stop the background log listener last
+        shutdown_logging()
 
 
 # For backward compatibility, keep the old CLI entry point
 def run_app():
     """
     Legacy CLI entry point for backward compatibility.
-    
+
     Note: New code should use parqv.cli.run_app() instead.
     """
     from .cli import run_app as new_run_app
@@ -5,20 +5,22 @@ Command Line Interface for parqv application.
 import sys
 
 from .app import ParqV
-from .core import SUPPORTED_EXTENSIONS, FileValidationError, validate_and_detect_file, setup_logging, get_logger
+from .core import SUPPORTED_TYPES_MESSAGE, FileValidationError, validate_and_detect_file, setup_logging, get_lazy_logger
+
+log = get_lazy_logger(__name__)
 
 
 def _print_user_message(message: str, log_level: str = "info") -> None:
     """
     Show a message to the user and log it.
-    
+
     Args:
         message: message to display and log
         log_level: log level ('info', 'error', 'warning')
     """
-    log = get_logger(__name__)
-
-    print(message, file=sys.stderr)
+    # Write directly instead of print(); skips sep/end handling and the
+    # per-call attribute machinery on a path error loops can hit repeatedly.
+    sys.stderr.write(message + "\n")
 
     if log_level == "error":
         log.error(message)
@@ -28,30 +30,61 @@ def _print_user_message(message: str, log_level: str = "info") -> None:
         log.info(message)
 
 
+# Flags recognized by parse_argv. Kept as a frozenset so option lookup is a
+# single hash probe; grow this set as options land instead of reaching for
+# argparse (whose import alone costs more than the whole parse).
+_KNOWN_FLAGS = frozenset()
+
+
+def parse_argv(argv: list) -> tuple:
+    """
+    Parse CLI arguments in a single pass without argparse.
+
+    Args:
+        argv: Full argument vector, including the program name at index 0
+
+    Returns:
+        Tuple of (file_path_str or None, dict of flag -> value)
+
+    Raises:
+        SystemExit: If an unrecognized flag is given
+    """
+    file_path_str = None
+    options = {}
+
+    for arg in argv[1:]:
+        if arg.startswith("--"):
+            flag, _, value = arg.partition("=")
+            if flag not in _KNOWN_FLAGS:
+                _print_user_message(f"Unknown option: {flag}", "error")
+                sys.exit(1)
+            options[flag] = value if value else True
+        elif file_path_str is None:
+            file_path_str = arg
+
+    return file_path_str, options
+
+
 def validate_cli_arguments() -> str:
     """
     Validates command line arguments.
-    
+
     Returns:
         The file path string from command line arguments
-        
+
     Raises:
         SystemExit: If arguments are invalid
     """
-    log = get_logger(__name__)
+    file_path_str, _options = parse_argv(sys.argv)
 
-    if len(sys.argv) < 2:
-        usage_message = "Usage: parqv <path_to_parquet_or_json_file>"
-        supported_message = f"Supported file types: {', '.join(SUPPORTED_EXTENSIONS.keys())}"
-
-        _print_user_message(usage_message, "error")
-        _print_user_message(supported_message, "info")
+    if file_path_str is None:
+        _print_user_message("Usage: parqv <path_to_parquet_or_json_file>", "error")
+        _print_user_message(SUPPORTED_TYPES_MESSAGE, "info")
 
         log.error("No file path provided via CLI arguments")
         sys.exit(1)
 
-    file_path_str = sys.argv[1]
-    log.debug(f"File path received from CLI: {file_path_str}")
+    log.debug("File path received from CLI: %s", file_path_str)
     return file_path_str
 
 
@@ -74,24 +107,22 @@ def run_app() -> None:
         file_path_str = validate_cli_arguments()
 
         # Validate file path and detect type (for early validation)
-        file_path, file_type = validate_and_detect_file(file_path_str)
-        log.info(f"File validated successfully: {file_path} (type: {file_type})")
+        file_path, file_type, file_stat = validate_and_detect_file(file_path_str)
+        log.info("File validated successfully: %s (type: %s)", file_path, file_type)
 
-        # Create and run the app
+        # Create and run the app, passing the validated result through so it
+        # isn't re-validated inside ParqV
         log.info("Starting parqv application...")
-        app = ParqV(file_path_str=file_path_str)
+        app = ParqV(file_path=file_path, handler_type=file_type, file_size=file_stat.st_size)
         app.run()
 
         log.info("parqv application finished successfully")
 
     except FileValidationError as e:
-        log.error(f"File validation failed: {e}")
-
-        error_message = f"Error: {e}"
-        help_message = f"Please provide a file with one of these extensions: {', '.join(SUPPORTED_EXTENSIONS.keys())}"
+        log.error("File validation failed: %s", e)
 
-        _print_user_message(error_message, "error")
-        _print_user_message(help_message, "info")
+        _print_user_message(f"Error: {e}", "error")
+        _print_user_message(SUPPORTED_TYPES_MESSAGE, "info")
 
         log.error("Exiting due to file validation error")
         sys.exit(1)
@@ -102,7 +133,7 @@ def run_app() -> None:
         sys.exit(0)
 
     except Exception as e:
-        log.exception(f"Unexpected error in CLI: {e}")
+        log.exception("Unexpected error in CLI: %s", e)
         _print_user_message(f"An unexpected error occurred: {e}", "error")
         _print_user_message("Check the log file for more details.", "info")
         sys.exit(1)
@@ -4,20 +4,23 @@ Core modules for parqv application.
 This package contains fundamental configuration, utilities, and factory classes.
 """
 
-from .config import SUPPORTED_EXTENSIONS, DEFAULT_PREVIEW_ROWS, CSS_PATH
-from .logging import setup_logging, get_logger
+from .config import SUPPORTED_EXTENSIONS, SUPPORTED_TYPES_MESSAGE, DEFAULT_PREVIEW_ROWS, CSS_PATH
+from .logging import setup_logging, shutdown_logging, get_logger, get_lazy_logger
 from .file_utils import FileValidationError, validate_and_detect_file, validate_file_path, detect_file_type
 from .handler_factory import HandlerFactory, HandlerCreationError
 
 __all__ = [
     # Configuration
     "SUPPORTED_EXTENSIONS",
+    "SUPPORTED_TYPES_MESSAGE",
     "DEFAULT_PREVIEW_ROWS", 
     "CSS_PATH",
     
     # Logging
     "setup_logging",
+    "shutdown_logging",
     "get_logger",
+    "get_lazy_logger",
     
     # File utilities
     "FileValidationError",
@@ -2,16 +2,28 @@
 Configuration constants and settings for parqv application.
 """
 
-from typing import Dict, Type, List
-from pathlib import Path
+from importlib.resources import files
+from types import MappingProxyType
+from typing import Final, Mapping
 
-# File extensions and their corresponding handler types
-SUPPORTED_EXTENSIONS: Dict[str, str] = {
+# File extensions and their corresponding handler types.
+# Keys are already lowercase; the mapping is read-only so lookups can rely on
+# it never changing after import.
+SUPPORTED_EXTENSIONS: Mapping[str, str] = MappingProxyType({
     ".parquet": "parquet",
-    ".json": "json", 
+    ".json": "json",
     ".ndjson": "json",
     ".csv": "csv"
-}
+})
+
+# Precomputed once at import for error/help messages on repeated CLI paths
+SUPPORTED_EXTENSIONS_STR: Final[str] = ", ".join(SUPPORTED_EXTENSIONS)
+
+# Ready-made user-facing help line, so CLI error paths allocate nothing
+SUPPORTED_TYPES_MESSAGE: Final[str] = f"Supported file types: {SUPPORTED_EXTENSIONS_STR}"
+
+# Fast membership set of the (lowercase) supported suffixes
+SUPPORTED_SUFFIXES: Final[frozenset] = frozenset(SUPPORTED_EXTENSIONS)
 
 # Application constants
 LOG_FILENAME = "parqv.log"
@@ -22,5 +34,6 @@ LOG_ENCODING = "utf-8"
 # UI Constants
 DEFAULT_PREVIEW_ROWS = 50
 
-# CSS Path (relative to the app module)
-CSS_PATH = "parqv.css" 
\ No newline at end of file
+# CSS Path, resolved once at import so Textual skips its relative-path
+# search loop (and so the path stays valid for installed wheels)
+CSS_PATH = str(files("parqv").joinpath("parqv.css"))
@@ -2,13 +2,15 @@
 File utilities for parqv application.
 """
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
-from .config import SUPPORTED_EXTENSIONS
-from .logging import get_logger
+from .config import SUPPORTED_EXTENSIONS, SUPPORTED_EXTENSIONS_STR, SUPPORTED_SUFFIXES
+from .logging import get_lazy_logger
 
-log = get_logger(__name__)
+log = get_lazy_logger(__name__)
 
 
 class FileValidationError(Exception):
@@ -16,73 +18,143 @@ class FileValidationError(Exception):
     pass
 
 
-def validate_file_path(file_path_str: Optional[str]) -> Path:
+def validate_file_path(file_path_str: Optional[str]) -> Tuple[Path, os.stat_result]:
     """
-    Validates and resolves the file path.
-    
+    Validates the file path with a single stat call.
+
+    The stat result is returned alongside the path so downstream code
+    (handlers, metadata summaries) can reuse it instead of re-stat'ing the
+    file — on network filesystems each extra stat is a round-trip.
+
     Args:
         file_path_str: String representation of the file path
-        
+
     Returns:
-        Resolved Path object
-        
+        Tuple of (Path object, os.stat_result for the file)
+
     Raises:
         FileValidationError: If file path is invalid or file doesn't exist
     """
     if not file_path_str:
         raise FileValidationError("No file path provided.")
-    
-    file_path = Path(file_path_str)
-    log.debug(f"Validating file path: {file_path}")
-    
-    if not file_path.is_file():
-        raise FileValidationError(f"File not found or is not a regular file: {file_path}")
-    
-    return file_path
+
+    log.debug("Validating file path: %s", file_path_str)
+
+    try:
+        file_stat = os.stat(file_path_str)
+    except OSError as e:
+        raise FileValidationError(
+            f"File not found or is not a regular file: {file_path_str}"
+        ) from e
+
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise FileValidationError(f"File not found or is not a regular file: {file_path_str}")
+
+    return Path(file_path_str), file_stat
 
 
 def detect_file_type(file_path: Path) -> str:
     """
     Detects the file type based on its extension.
-    
+
     Args:
         file_path: Path object representing the file
-        
+
     Returns:
         String representing the detected file type ('parquet' or 'json')
-        
+
     Raises:
         FileValidationError: If file extension is not supported
     """
-    file_suffix = file_path.suffix.lower()
-    
-    if file_suffix not in SUPPORTED_EXTENSIONS:
-        supported_exts = ", ".join(SUPPORTED_EXTENSIONS.keys())
+    # Suffixes are usually already lowercase; only pay for .lower() on a miss
+    file_suffix = file_path.suffix
+    if file_suffix not in SUPPORTED_SUFFIXES:
+        file_suffix = file_suffix.lower()
+
+    detected_type = SUPPORTED_EXTENSIONS.get(file_suffix)
+    if detected_type is None:
         raise FileValidationError(
             f"Unsupported file extension: '{file_suffix}'. "
-            f"Only {supported_exts} are supported."
+            f"Only {SUPPORTED_EXTENSIONS_STR} are supported."
         )
-    
-    detected_type = SUPPORTED_EXTENSIONS[file_suffix]
-    log.info(f"Detected '{file_suffix}' extension, type: {detected_type}")
-    
+
+    log.info("Detected '%s' extension, type: %s", file_suffix, detected_type)
+
     return detected_type
 
 
-def validate_and_detect_file(file_path_str: Optional[str]) -> Tuple[Path, str]:
+def iter_supported_files(root: Path) -> Iterator[Tuple[Path, str]]:
+    """
+    Recursively yield (path, detected_type) for supported files under a directory.
+
+    Uses os.scandir so file-vs-directory checks reuse the dirent type cached
+    by the directory read instead of issuing a stat per entry, and yields
+    lazily so callers can start on the first file before the walk finishes.
+
+    Args:
+        root: Directory to enumerate
+
+    Yields:
+        Tuples of (Path to the file, handler type string)
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        log.warning("Could not scan directory %s: %s", root, e)
+        return
+
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_supported_files(Path(entry.path))
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix not in SUPPORTED_SUFFIXES:
+                suffix = suffix.lower()
+            detected_type = SUPPORTED_EXTENSIONS.get(suffix)
+            if detected_type is not None:
+                yield Path(entry.path), detected_type
+
+
+def validate_and_detect_file(file_path_str: Optional[str]) -> Tuple[Path, str, os.stat_result]:
     """
     Convenience function that validates file path and detects file type.
-    
+
     Args:
         file_path_str: String representation of the file path
-        
+
     Returns:
-        Tuple of (validated_path, detected_type)
-        
+        Tuple of (validated_path, detected_type, stat_result)
+
     Raises:
         FileValidationError: If validation or type detection fails
     """
-    file_path = validate_file_path(file_path_str)
-    file_type = detect_file_type(file_path)
-    
-    return file_path, file_type 
\ No newline at end of file
+    # Cheap pre-checks first, so obvious typos never pay for the stat call
+    # (which can take seconds for a nonexistent path on a network filesystem).
+    if not file_path_str:
+        raise FileValidationError("No file path provided.")
+
+    if len(file_path_str) > 4096 or file_path_str.endswith(("/", os.sep)):
+        raise FileValidationError(
+            f"File not found or is not a regular file: {file_path_str}"
+        )
+
+    suffix = os.path.splitext(file_path_str)[1]
+    if suffix not in SUPPORTED_SUFFIXES:
+        suffix = suffix.lower()
+    file_type = SUPPORTED_EXTENSIONS.get(suffix)
+    if file_type is None:
+        raise FileValidationError(
+            f"Unsupported file extension: '{suffix}'. "
+            f"Only {SUPPORTED_EXTENSIONS_STR} are supported."
+        )
+
+    file_path, file_stat = validate_file_path(file_path_str)
+
+    return file_path, file_type, file_stat
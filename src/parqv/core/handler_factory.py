@@ -2,13 +2,20 @@
 Handler factory for creating appropriate data handlers based on file type.
 """
 
+import os
+from collections import OrderedDict
+from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
-from ..data_sources import DataHandler, DataHandlerError, ParquetHandler, JsonHandler, CsvHandler
-from .logging import get_logger
+if TYPE_CHECKING:
+    # Imported lazily at call time to avoid a circular import: the handler
+    # base module itself imports parqv.core for logging.
+    from ..data_sources.base import DataHandler
 
-log = get_logger(__name__)
+from .logging import get_lazy_logger
+
+log = get_lazy_logger(__name__)
 
 
 class HandlerCreationError(Exception):
@@ -18,26 +25,65 @@ class HandlerCreationError(Exception):
 
 class HandlerFactory:
     """Factory class for creating data handlers."""
-    
-    # Registry of handler types to handler classes
-    _HANDLER_REGISTRY = {
-        "parquet": ParquetHandler,
-        "json": JsonHandler,
-        "csv": CsvHandler,
+
+    # Registry of handler types to handler classes.
+    # Entries are either a resolved DataHandler subclass or a lazy
+    # (module_path, class_name) reference; lazy entries are imported on first
+    # use so that e.g. opening a CSV file never pays for the pyarrow import.
+    _HANDLER_REGISTRY: dict = {
+        "parquet": ("parqv.data_sources.formats.parquet", "ParquetHandler"),
+        "json": ("parqv.data_sources.formats.json", "JsonHandler"),
+        "csv": ("parqv.data_sources.formats.csv", "CsvHandler"),
     }
-    
+
+    # Small LRU of open handlers keyed on (type, resolved path, mtime_ns, size)
+    # so re-opening an unchanged file (watch mode, tests) skips e.g. the
+    # Parquet footer parse. Only handlers with CACHEABLE = True are cached.
+    _HANDLER_CACHE: "OrderedDict[tuple, 'DataHandler']" = OrderedDict()
+    _HANDLER_CACHE_SIZE = 4
+
+    @classmethod
+    def _resolve_handler_class(cls, handler_type: str) -> "type[DataHandler]":
+        """
+        Resolve the handler class for a type, importing lazily if needed.
+
+        Args:
+            handler_type: String identifier for the handler type
+
+        Returns:
+            The resolved DataHandler subclass
+        """
+        entry = cls._HANDLER_REGISTRY[handler_type]
+
+        if isinstance(entry, tuple):
+            module_path, class_name = entry
+            log.debug("Lazily importing %s from %s", class_name, module_path)
+            handler_class = getattr(import_module(module_path), class_name)
+            # Memoize the resolved class so subsequent lookups skip the import machinery
+            cls._HANDLER_REGISTRY[handler_type] = handler_class
+            return handler_class
+
+        return entry
+
     @classmethod
-    def create_handler(cls, file_path: Path, handler_type: str) -> DataHandler:
+    def create_handler(
+            cls,
+            file_path: Path,
+            handler_type: str,
+            file_size: Optional[int] = None,
+    ) -> "DataHandler":
         """
         Creates an appropriate handler for the given file type.
-        
+
         Args:
             file_path: Path to the data file
             handler_type: Type of handler to create ('parquet' or 'json')
-            
+            file_size: Optional pre-computed file size in bytes from validation,
+                passed through so handlers avoid re-stat'ing the file
+
         Returns:
             An instance of the appropriate DataHandler subclass
-            
+
         Raises:
             HandlerCreationError: If handler creation fails
         """
@@ -47,44 +93,113 @@ class HandlerFactory:
                 f"Unknown handler type: '{handler_type}'. "
                 f"Available types: {available_types}"
             )
-        
-        handler_class = cls._HANDLER_REGISTRY[handler_type]
-        
-        log.info(f"Creating {handler_type.capitalize()} handler for: {file_path}")
-        
+
+        try:
+            handler_class = cls._resolve_handler_class(handler_type)
+        except (ImportError, AttributeError) as e:
+            log.exception("Failed to import handler class for type '%s'", handler_type)
+            raise HandlerCreationError(
+                f"Could not load {handler_type} handler implementation: {e}"
+            ) from e
+
+        cache_key = None
+        if getattr(handler_class, "CACHEABLE", False):
+            cache_key = cls._make_cache_key(file_path, handler_type)
+            if cache_key is not None:
+                cached = cls._HANDLER_CACHE.get(cache_key)
+                if cached is not None:
+                    # A closed handler has detached its finalizer; don't reuse it
+                    if cached._finalizer is not None and cached._finalizer.alive:
+                        cls._HANDLER_CACHE.move_to_end(cache_key)
+                        log.info("Reusing cached %s handler for: %s", handler_type, file_path)
+                        return cached
+                    del cls._HANDLER_CACHE[cache_key]
+
+        log.info("Creating %s handler for: %s", handler_type.capitalize(), file_path)
+
+        from ..data_sources.base import DataHandlerError
+
         try:
-            handler = handler_class(file_path)
-            log.info(f"{handler_type.capitalize()} handler created successfully.")
+            handler = handler_class(file_path, file_size=file_size)
+            log.info("%s handler created successfully.", handler_type.capitalize())
+            if cache_key is not None:
+                cls._HANDLER_CACHE[cache_key] = handler
+                while len(cls._HANDLER_CACHE) > cls._HANDLER_CACHE_SIZE:
+                    _, evicted = cls._HANDLER_CACHE.popitem(last=False)
+                    try:
+                        evicted.close()
+                    except Exception:
+                        log.warning("Error closing evicted cached handler", exc_info=True)
             return handler
-            
+
         except DataHandlerError as e:
-            log.error(f"Failed to create {handler_type} handler: {e}")
+            log.error("Failed to create %s handler: %s", handler_type, e)
             raise HandlerCreationError(f"Failed to initialize {handler_type} handler: {e}") from e
-            
+
         except Exception as e:
-            log.exception(f"Unexpected error creating {handler_type} handler")
+            log.exception("Unexpected error creating %s handler", handler_type)
             raise HandlerCreationError(
                 f"Unexpected error during {handler_type} handler creation: {e}"
             ) from e
-    
+
+    @staticmethod
+    def _make_cache_key(file_path: Path, handler_type: str) -> Optional[tuple]:
+        """
+        Build a cache key that changes whenever the file content could have.
+
+        Returns:
+            (handler_type, resolved path, mtime_ns, size), or None if the
+            file couldn't be stat'ed (in which case caching is skipped).
+        """
+        try:
+            resolved = os.path.realpath(file_path)
+            st = os.stat(resolved)
+        except OSError:
+            return None
+        return (handler_type, resolved, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def invalidate(cls, file_path: Path) -> None:
+        """
+        Drop (and close) any cached handlers for the given path.
+
+        Args:
+            file_path: Path whose cached handlers should be discarded
+        """
+        resolved = os.path.realpath(file_path)
+        for key in [k for k in cls._HANDLER_CACHE if k[1] == resolved]:
+            handler = cls._HANDLER_CACHE.pop(key)
+            try:
+                handler.close()
+            except Exception:
+                log.warning("Error closing invalidated cached handler", exc_info=True)
+
     @classmethod
     def get_supported_types(cls) -> list[str]:
         """
         Returns a list of supported handler types.
-        
+
         Returns:
             List of supported handler type strings
         """
         return list(cls._HANDLER_REGISTRY.keys())
-    
+
     @classmethod
-    def register_handler(cls, handler_type: str, handler_class: type[DataHandler]) -> None:
+    def register_handler(
+            cls,
+            handler_type: str,
+            handler_class: "Union[type[DataHandler], Tuple[str, str]]",
+    ) -> None:
         """
         Registers a new handler type (for extensibility).
-        
+
         Args:
             handler_type: String identifier for the handler type
-            handler_class: Class that implements DataHandler interface
+            handler_class: Class that implements DataHandler interface, or a
+                lazy (module_path, class_name) reference imported on first use
         """
-        log.info(f"Registering handler type '{handler_type}' with class {handler_class.__name__}")
-        cls._HANDLER_REGISTRY[handler_type] = handler_class 
\ No newline at end of file
+        if isinstance(handler_class, tuple):
+            log.info("Registering handler type '%s' with lazy reference %s", handler_type, handler_class)
+        else:
+            log.info("Registering handler type '%s' with class %s", handler_type, handler_class.__name__)
+        cls._HANDLER_REGISTRY[handler_type] = handler_class
@@ -2,45 +2,127 @@
 Logging configuration for parqv application.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
 
 from .config import LOG_FILENAME, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_ENCODING
 
+LOG_FORMAT = "%(asctime)s [%(levelname)-5.5s] %(name)s (%(filename)s:%(lineno)d) - %(message)s"
+
+# Background listener draining the log queue; started by setup_logging
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> logging.Logger:
     """
     Sets up logging configuration for the parqv application.
-    
+
+    Application threads only enqueue records via a QueueHandler; the actual
+    formatting and file/stream I/O happens on a background QueueListener
+    thread, so logging never stalls the TUI render loop.
+
     Returns:
         The root logger instance configured for parqv.
     """
+    global _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
     file_handler = RotatingFileHandler(
-        LOG_FILENAME, 
-        maxBytes=LOG_MAX_BYTES, 
-        backupCount=LOG_BACKUP_COUNT, 
+        LOG_FILENAME,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
         encoding=LOG_ENCODING
     )
-    
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    queue_handler = QueueHandler(log_queue)
+    # Pass records through unformatted; the listener's handlers do the real
+    # formatting on the background thread.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)-5.5s] %(name)s (%(filename)s:%(lineno)d) - %(message)s",
-        handlers=[file_handler, logging.StreamHandler(sys.stdout)],
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
-    
+
+    shutdown_logging()  # Stop a previous listener if setup_logging is called twice
+    _listener = QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
     return logging.getLogger(__name__)
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener, flushing any queued records.
+
+    Safe to call multiple times; does nothing if the listener isn't running.
+    """
+    global _listener
+    if _listener is not None:
+        try:
+            _listener.stop()
+        finally:
+            _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Gets a logger instance for the given name.
-    
+
     Args:
         name: The name for the logger (typically __name__)
-        
+
     Returns:
         A logger instance.
     """
-    return logging.getLogger(name) 
\ No newline at end of file
+    return logging.getLogger(name)
+
+
+class _LazyLogger:
+    """
+    Proxy that defers logging.getLogger until the logger is first used.
+
+    Module-level `log = get_lazy_logger(__name__)` lines then cost a tiny
+    proxy allocation at import instead of registering a Logger in the
+    logging manager for modules that may never log.
+    """
+
+    __slots__ = ("_name", "_logger")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._logger: Optional[logging.Logger] = None
+
+    def __getattr__(self, attr: str):
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = logging.getLogger(self._name)
+        return getattr(logger, attr)
+
+
+def get_lazy_logger(name: str) -> _LazyLogger:
+    """
+    Gets a lazily-resolved logger proxy for module-level use.
+
+    Args:
+        name: The name for the logger (typically __name__)
+
+    Returns:
+        A proxy that resolves the real logger on first use.
+    """
+    return _LazyLogger(name)
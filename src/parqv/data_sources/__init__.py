@@ -17,15 +17,17 @@ from .base import (
     MetadataError,
 )
 
-# Format-specific handlers
-from .formats import (
-    ParquetHandler,
-    ParquetHandlerError,
-    JsonHandler,
-    JsonHandlerError,
-    CsvHandler,
-    CsvHandlerError,
-)
+# Format-specific handlers are imported lazily (PEP 562) so that importing
+# parqv.data_sources does not drag in pyarrow/pandas/duckdb for formats the
+# user never opens.
+_FORMAT_EXPORTS = {
+    "ParquetHandler": "parquet",
+    "ParquetHandlerError": "parquet",
+    "JsonHandler": "json",
+    "JsonHandlerError": "json",
+    "CsvHandler": "csv",
+    "CsvHandlerError": "csv",
+}
 
 __all__ = [
     # Base interface and exceptions
@@ -33,11 +35,11 @@ __all__ = [
     "DataHandlerError",
     "DataSourceError",
     "FileValidationError",
-    "UnsupportedFormatError", 
+    "UnsupportedFormatError",
     "DataReadError",
     "SchemaError",
     "MetadataError",
-    
+
     # Format handlers
     "ParquetHandler",
     "ParquetHandlerError",
@@ -45,4 +47,17 @@ __all__ = [
     "JsonHandlerError",
     "CsvHandler",
     "CsvHandlerError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Lazily import format handlers on first attribute access."""
+    module_name = _FORMAT_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    attr = getattr(import_module(f".formats.{module_name}", __name__), name)
+    globals()[name] = attr  # Cache so subsequent lookups skip __getattr__
+    return attr
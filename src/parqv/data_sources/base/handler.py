@@ -2,14 +2,39 @@
 Base data handler interface for parqv data sources.
 """
 
+import weakref
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
+if TYPE_CHECKING:
+    # Only needed for type annotations; keeps `import parqv` from paying
+    # for the pandas import when no data is ever previewed.
+    import pandas as pd
 
 from ...core import get_logger
 
+def _close_resources(resources) -> None:
+    """Best-effort close of raw resources when a handler is garbage collected."""
+    for resource in resources:
+        try:
+            close = getattr(resource, "close", None)
+            if close is not None:
+                close()
+        except Exception:
+            # Never raise during interpreter cleanup
+            pass
+
+
+# Unit table for format_size, hoisted so the 1024**n constants are computed once
+_SIZE_UNITS = (
+    ("bytes", 1),
+    ("KB", 1024),
+    ("MB", 1024 ** 2),
+    ("GB", 1024 ** 3),
+    ("TB", 1024 ** 4),
+)
+
 
 class DataHandler(ABC):
     """
@@ -19,20 +44,40 @@ class DataHandler(ABC):
     to interact with different data file formats.
     """
 
-    def __init__(self, file_path: Path):
+    # Slotted to avoid a per-instance __dict__; subclasses declare their own
+    # __slots__ for any additional attributes they store.
+    __slots__ = ("file_path", "file_size", "_finalizer", "__weakref__")
+
+    # Class-level logger, set once per subclass instead of per instance
+    logger = get_logger(__name__)
+
+    # Whether HandlerFactory may cache and reuse open instances of this
+    # handler for an unchanged file. Opt-in: only cheap, read-only handlers
+    # (e.g. Parquet, which just holds a file reader) should set this.
+    CACHEABLE = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Assign each handler subclass its own logger once, at class creation."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(f"{cls.__module__}.{cls.__name__}")
+
+    def __init__(self, file_path: Path, file_size: Optional[int] = None):
         """
         Initialize the handler with the file path.
-        
+
         Subclasses should open the file or set up necessary resources here.
 
         Args:
             file_path: Path to the data file.
+            file_size: Optional pre-computed file size in bytes (from the
+                validation stat), so handlers don't need to stat the file again.
 
         Raises:
             DataHandlerError: If initialization fails (e.g., file not found, format error).
         """
         self.file_path = file_path
-        self.logger = get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.file_size = file_size
+        self._finalizer: Optional[weakref.finalize] = None
 
     @abstractmethod
     def close(self) -> None:
@@ -73,7 +118,7 @@ class DataHandler(ABC):
         pass
 
     @abstractmethod
-    def get_data_preview(self, num_rows: int = 50) -> Optional[pd.DataFrame]:
+    def get_data_preview(self, num_rows: int = 50) -> Optional["pd.DataFrame"]:
         """
         Fetch a preview of the data.
 
@@ -107,24 +152,57 @@ class DataHandler(ABC):
         """
         pass
 
+    def _get_file_size(self) -> Optional[int]:
+        """
+        Return the file size in bytes, stat'ing the file at most once.
+
+        Returns:
+            File size in bytes, or None if the size could not be determined.
+        """
+        if self.file_size is None:
+            try:
+                self.file_size = self.file_path.stat().st_size
+            except OSError as e:
+                self.logger.warning(f"Could not get file size for {self.file_path}: {e}")
+                return None
+        return self.file_size
+
     def format_size(self, num_bytes: int) -> str:
         """
         Format bytes into a human-readable string.
-        
+
         Args:
             num_bytes: Number of bytes to format
-            
+
         Returns:
             Human-readable size string
         """
-        if num_bytes < 1024:
+        # Each unit covers 10 bits, so bit_length picks the unit directly
+        # without a branch chain or re-computing 1024**n per call.
+        idx = min(max(0, (num_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+        if idx == 0:
             return f"{num_bytes} bytes"
-        elif num_bytes < 1024 ** 2:
-            return f"{num_bytes / 1024:.1f} KB"
-        elif num_bytes < 1024 ** 3:
-            return f"{num_bytes / 1024 ** 2:.1f} MB"
-        else:
-            return f"{num_bytes / 1024 ** 3:.1f} GB"
+        name, divisor = _SIZE_UNITS[idx]
+        return f"{num_bytes / divisor:.1f} {name}"
+
+    def _register_finalizer(self, *resources: Any) -> None:
+        """
+        Register raw resources to be closed if the handler is garbage
+        collected without an explicit close().
+
+        Unlike a __del__ method, weakref.finalize doesn't block collection
+        of reference cycles and runs at most once.
+
+        Args:
+            resources: Objects with a close() method (file handles, connections).
+        """
+        self._finalizer = weakref.finalize(self, _close_resources, resources)
+
+    def _detach_finalizer(self) -> None:
+        """Cancel the GC finalizer; call from close() once resources are released."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
     def __enter__(self):
         """Enter the runtime context related to this object."""
@@ -133,11 +211,3 @@ class DataHandler(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the runtime context related to this object, ensuring cleanup."""
         self.close()
-
-    def __del__(self):
-        """Attempt to close the handler when the object is garbage collected (best effort)."""
-        try:
-            self.close()
-        except Exception:
-            # Ignore exceptions during garbage collection
-            pass
@@ -2,13 +2,36 @@
 CSV file handler for parqv data sources.
 """
 
+import csv
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 from ..base import DataHandler, DataHandlerError
 
+# Tokens treated as missing values in addition to Arrow/pandas defaults
+_NA_VALUES = ['', 'NULL', 'null', 'None', 'N/A', 'n/a', 'NaN', 'nan', '\\N']
+
+# Candidate delimiters offered to the sniffer, in order of likelihood
+_SNIFF_DELIMITERS = ',;\t|'
+
+# Cheap pre-filter for datetime inference: ISO-ish dates start with a year
+_DATE_PREFIX_RE = re.compile(r'^\d{4}[-/]\d')
+
+# Boolean tokens for the fallback type inference: categorizing against this
+# fixed vocabulary yields integer codes that index straight into the lookup
+# table below (slot 10 catches unmatched values / NA, coded -1).
+_BOOL_CATEGORIES = ['true', 't', '1', 'yes', 'y', 'false', 'f', '0', 'no', 'n']
+_BOOL_LOOKUP = np.array([True] * 5 + [False] * 5 + [None], dtype=object)
+
 
 class CsvHandlerError(DataHandlerError):
     """Custom exception for CSV handling errors."""
@@ -23,27 +46,44 @@ class CsvHandler(DataHandler):
     for CSV files using pandas DataFrame operations.
     """
 
-    def __init__(self, file_path: Path):
+    __slots__ = (
+        "_df", "_head_batch", "_delimiter", "_original_dtypes", "_arrow_table",
+        "_stats_cache", "_types_summary",
+    )
+
+    def __init__(self, file_path: Path, file_size: Optional[int] = None):
         """
-        Initialize the CsvHandler by validating the path and reading the CSV file.
+        Initialize the CsvHandler by validating the path and reading the CSV head.
+
+        Only the first record batch is parsed here — enough for column names,
+        inferred types, and a preview. The full parse is deferred until code
+        actually touches `self.df` (e.g. row counts or column statistics), so
+        metadata-only sessions never pay for it.
 
         Args:
             file_path: Path to the CSV file.
+            file_size: Optional pre-computed file size in bytes from validation.
 
         Raises:
             CsvHandlerError: If the file is not found, not a file, or cannot be read.
         """
-        super().__init__(file_path)
-        self.df: Optional[pd.DataFrame] = None
+        super().__init__(file_path, file_size)
+        self._df: Optional[pd.DataFrame] = None
+        self._head_batch = None
+        self._arrow_table: Optional[pa.Table] = None
+        # Data is immutable after load, so per-column stats and the column
+        # type summary can be computed once and reused across UI selections
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+        self._types_summary: Optional[Dict[str, int]] = None
+        self._delimiter: str = ','
         self._original_dtypes: Optional[Dict[str, str]] = None
 
         try:
-            # Validate file existence
-            if not self.file_path.is_file():
+            # Validate file existence (skipped when the caller already stat'ed the file)
+            if self.file_size is None and not self.file_path.is_file():
                 raise FileNotFoundError(f"CSV file not found or is not a regular file: {self.file_path}")
 
-            # Read the CSV file with pandas
-            self._read_csv_file()
+            self._read_csv_head()
 
             self.logger.info(f"Successfully initialized CsvHandler for: {self.file_path.name}")
 
@@ -60,110 +100,454 @@ class CsvHandler(DataHandler):
             self.logger.exception(f"Unexpected error initializing CsvHandler for {self.file_path.name}")
             raise CsvHandlerError(f"Failed to initialize CSV handler '{self.file_path.name}': {e}") from e
 
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """The full DataFrame, parsed on first access and memoized."""
+        if self._df is None and self._head_batch is not None:
+            self.logger.debug("First full-data access; parsing complete CSV file")
+            self._read_csv_file()
+        return self._df
+
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]) -> None:
+        self._df = value
+
+    def _sniff_delimiter(self) -> str:
+        """
+        Detect the delimiter from a small head read instead of letting a
+        parser auto-sniff the whole file.
+
+        Returns:
+            The detected delimiter character, defaulting to ','.
+        """
+        try:
+            with open(self.file_path, 'rb') as f:
+                sample = f.read(65536).decode('utf-8', errors='replace')
+            return csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS).delimiter
+        except (OSError, csv.Error) as e:
+            self.logger.debug(f"Delimiter sniff failed ({e}); defaulting to ','")
+            return ','
+
+    def _read_csv_head(self) -> None:
+        """
+        Parse just the first record batch to learn column names and types.
+
+        Uses Arrow's incremental reader so only one block is parsed; files
+        the Arrow reader rejects outright fall back to an eager pandas read.
+        """
+        self._delimiter = self._sniff_delimiter()
+
+        try:
+            with pacsv.open_csv(
+                    self.file_path,
+                    read_options=pacsv.ReadOptions(encoding='utf-8', block_size=1 << 20),
+                    parse_options=pacsv.ParseOptions(delimiter=self._delimiter),
+                    convert_options=pacsv.ConvertOptions(
+                        null_values=_NA_VALUES,
+                        strings_can_be_null=True,
+                    ),
+            ) as reader:
+                try:
+                    head_batch = reader.read_next_batch()
+                except StopIteration:
+                    # Header-only file: no data rows, but the header still
+                    # defines a valid schema and an empty preview
+                    head_batch = pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+            if self._has_binary_columns(head_batch.schema):
+                self.logger.warning(
+                    "Arrow read produced binary columns (likely non-UTF-8 data); "
+                    "falling back to pandas"
+                )
+            else:
+                self._head_batch = head_batch
+                self._original_dtypes = {
+                    field.name: self._arrow_type_label(field.type)
+                    for field in self._head_batch.schema
+                }
+                self.logger.debug(
+                    f"Read CSV head batch: {self._head_batch.num_rows} rows, "
+                    f"{self._head_batch.num_columns} columns"
+                )
+                return
+
+        except pa.ArrowInvalid as arrow_e:
+            if "Empty CSV file" in str(arrow_e):
+                raise pd.errors.EmptyDataError(str(arrow_e)) from arrow_e
+            self.logger.warning(f"Arrow CSV reader failed ({arrow_e}); falling back to pandas")
+        except pa.ArrowException as arrow_e:
+            self.logger.warning(f"Arrow CSV reader failed ({arrow_e}); falling back to pandas")
+
+        self._read_csv_file_pandas(self._delimiter)
+
     def _read_csv_file(self) -> None:
-        """Read the CSV file using pandas with appropriate settings."""
+        """
+        Read the full CSV file with Arrow's multithreaded C++ parser.
+
+        Arrow infers column types during the parse, so the per-column
+        inference pass is only needed on the pandas fallback path (exotic
+        dialects or encodings the Arrow reader rejects).
+
+        Set PARQV_CSV_BACKEND=polars to route the read through polars'
+        multithreaded Rust parser instead (opt-in; needs polars installed).
+        """
+        if os.environ.get('PARQV_CSV_BACKEND') == 'polars' and self._read_csv_polars():
+            return
+
+        self._advise_sequential_read()
+
         try:
-            # Read CSV with automatic type inference
-            self.df = pd.read_csv(
-                self.file_path,
-                # Basic settings
-                encoding='utf-8',
-                # Handle various separators automatically
-                sep=None,  # Let pandas auto-detect
-                engine='python',  # More flexible parsing
-                # Preserve original string representation for better type info
-                dtype=str,  # Read everything as string first
-                na_values=['', 'NULL', 'null', 'None', 'N/A', 'n/a', 'NaN', 'nan'],
-                keep_default_na=True,
+            source = self._open_csv_source()
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(encoding='utf-8', block_size=16 << 20),
+                parse_options=pacsv.ParseOptions(delimiter=self._delimiter),
+                convert_options=pacsv.ConvertOptions(
+                    null_values=_NA_VALUES,
+                    strings_can_be_null=True,
+                ),
             )
+            if self._has_binary_columns(table.schema):
+                self.logger.warning(
+                    "Arrow read produced binary columns (likely non-UTF-8 data); "
+                    "falling back to pandas"
+                )
+            else:
+                # Keep the Arrow table around: column statistics run much faster
+                # on its buffers via pyarrow.compute than on the pandas view
+                self._arrow_table = table
+                # Arrow-backed dtypes keep strings in UTF-8 buffers instead of
+                # boxing each cell into a Python object
+                self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+                self._original_dtypes = {
+                    col: self._dtype_label(dtype) for col, dtype in self.df.dtypes.items()
+                }
+                self.logger.debug(f"Successfully read CSV with shape: {self.df.shape}")
+                return
+
+        except pa.ArrowInvalid as arrow_e:
+            if "Empty CSV file" in str(arrow_e):
+                raise pd.errors.EmptyDataError(str(arrow_e)) from arrow_e
+            self.logger.warning(f"Arrow CSV reader failed ({arrow_e}); falling back to pandas")
+        except pa.ArrowException as arrow_e:
+            self.logger.warning(f"Arrow CSV reader failed ({arrow_e}); falling back to pandas")
+
+        self._read_csv_file_pandas(self._delimiter)
+
+    @staticmethod
+    def _has_binary_columns(schema: pa.Schema) -> bool:
+        """
+        True if any column came back as binary rather than string.
+
+        Arrow's CSV reader does not raise on invalid UTF-8 — it silently
+        types the offending columns as binary. Treat that as a reader
+        failure so the pandas path's encoding detection gets to run.
+        """
+        return any(
+            pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+            for field in schema
+        )
+
+    def _detect_encoding(self) -> Optional[str]:
+        """
+        Detect the file encoding from a 256KB head sample.
+
+        Uses charset_normalizer when installed (one cheap scan instead of a
+        full-file re-parse per candidate encoding); returns None when the
+        library is unavailable or detection fails, in which case the caller
+        falls back to trying common encodings.
+        """
+        try:
+            from charset_normalizer import from_bytes
+        except ImportError:
+            return None
+
+        try:
+            with open(self.file_path, 'rb') as f:
+                sample = f.read(262144)
+            best = from_bytes(sample).best()
+        except OSError as e:
+            self.logger.debug(f"Encoding detection failed: {e}")
+            return None
+
+        if best is not None:
+            self.logger.info(f"Detected encoding '{best.encoding}' from head sample")
+            return best.encoding
+        return None
+
+    def _advise_sequential_read(self) -> None:
+        """
+        Tell the kernel we're about to stream the whole file.
+
+        POSIX_FADV_SEQUENTIAL doubles the readahead window and WILLNEED
+        starts prefetching immediately, so the parser stalls less on
+        cold-cache reads. Silently a no-op where unsupported (e.g. macOS).
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.debug(f"posix_fadvise failed: {e}")
+
+    def _open_csv_source(self):
+        """
+        Memory-map the file for the parser when possible.
 
-            # Store original dtypes before conversion
-            self._original_dtypes = {col: 'string' for col in self.df.columns}
+        A mapped buffer lets Arrow read straight out of the page cache with
+        no read() syscalls or kernel-to-userspace copies; fall back to the
+        plain path on failure (Arrow then does buffered reads itself).
+        """
+        try:
+            return pa.memory_map(str(self.file_path), 'r')
+        except (OSError, pa.ArrowException) as e:
+            self.logger.debug(f"memory_map failed ({e}); using buffered reads")
+            return str(self.file_path)
 
-            # Try to infer better types
-            self._infer_types()
+    def _read_csv_polars(self) -> bool:
+        """
+        Opt-in polars read path; hands the parsed data to Arrow zero-copy.
 
-            self.logger.debug(f"Successfully read CSV with shape: {self.df.shape}")
+        Returns:
+            True on success; False (after logging) so the caller falls back
+            to the default Arrow reader.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            self.logger.warning(
+                "PARQV_CSV_BACKEND=polars set but polars is not installed; using Arrow reader"
+            )
+            return False
 
-        except UnicodeDecodeError:
-            # Try with different encodings
-            for encoding in ['latin1', 'cp1252', 'iso-8859-1']:
+        try:
+            lazy_frame = pl.scan_csv(
+                self.file_path,
+                separator=self._delimiter,
+                null_values=_NA_VALUES,
+                infer_schema_length=10_000,
+            )
+            table = lazy_frame.collect().to_arrow()
+            self._arrow_table = table
+            self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            self._original_dtypes = {
+                col: self._dtype_label(dtype) for col, dtype in self.df.dtypes.items()
+            }
+            self.logger.info(f"Read CSV with polars backend: shape {self.df.shape}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"polars CSV read failed ({e}); using Arrow reader")
+            return False
+
+    def _read_csv_file_pandas(self, delimiter: str) -> None:
+        """Fallback reader using pandas for files the Arrow parser rejects."""
+        # utf-8 first; if it fails, one head-sample detection replaces the
+        # old strategy of re-parsing the whole file per candidate encoding
+        encodings = ['utf-8']
+        for encoding in encodings:
+            try:
+                self.df = self._read_with_pandas_engine(delimiter, encoding)
+                self._original_dtypes = {col: 'string' for col in self.df.columns}
+                self._infer_types()
                 try:
-                    self.logger.warning(f"Trying encoding: {encoding}")
-                    self.df = pd.read_csv(
-                        self.file_path,
-                        encoding=encoding,
-                        sep=None,
-                        engine='python',
-                        dtype=str,
-                        na_values=['', 'NULL', 'null', 'None', 'N/A', 'n/a', 'NaN', 'nan'],
-                        keep_default_na=True,
+                    # Move the inferred columns onto Arrow-backed dtypes so
+                    # strings live in UTF-8 buffers instead of object arrays
+                    # of boxed str, matching the primary reader's output.
+                    self.df = self.df.convert_dtypes(dtype_backend='pyarrow')
+                except (TypeError, ValueError) as convert_e:
+                    self.logger.warning(f"Could not convert to Arrow-backed dtypes: {convert_e}")
+                self.logger.info(f"Successfully read CSV with pandas (encoding: {encoding})")
+                return
+            except UnicodeDecodeError:
+                self.logger.warning(f"Encoding {encoding} failed; trying next")
+                if len(encodings) == 1:
+                    detected = self._detect_encoding()
+                    if detected and detected not in encodings:
+                        encodings.append(detected)
+                    encodings.extend(
+                        e for e in ('latin1', 'cp1252', 'iso-8859-1') if e not in encodings
                     )
-                    self._original_dtypes = {col: 'string' for col in self.df.columns}
-                    self._infer_types()
-                    self.logger.info(f"Successfully read CSV with encoding: {encoding}")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise CsvHandlerError(f"Could not decode CSV file with any common encoding")
+                continue
 
-    def _infer_types(self) -> None:
-        """Infer appropriate data types for columns."""
-        if self.df is None:
-            return
+        raise CsvHandlerError("Could not decode CSV file with any common encoding")
 
-        for col in self.df.columns:
-            # Try to convert to numeric
-            numeric_converted = pd.to_numeric(self.df[col], errors='coerce')
-            if not numeric_converted.isna().all():
-                # If most values can be converted to numeric, use numeric type
-                non_na_original = self.df[col].notna().sum()
-                non_na_converted = numeric_converted.notna().sum()
-
-                if non_na_converted / max(non_na_original, 1) > 0.8:  # 80% conversion success
-                    self.df[col] = numeric_converted
-                    if (numeric_converted == numeric_converted.astype('Int64', errors='ignore')).all():
-                        self._original_dtypes[col] = 'integer'
-                    else:
-                        self._original_dtypes[col] = 'float'
-                    continue
+    def _read_with_pandas_engine(self, delimiter: str, encoding: str) -> pd.DataFrame:
+        """
+        Read with pandas' C engine, retrying with the python engine only on
+        parse errors — the C parser is several times faster and the sniffed
+        delimiter removes the original reason for engine='python'.
+        """
+        kwargs = dict(
+            encoding=encoding,
+            sep=delimiter,
+            # Preserve original string representation for better type info
+            dtype=str,  # Read everything as string first
+            na_values=_NA_VALUES,
+            keep_default_na=True,
+        )
+        try:
+            return pd.read_csv(self.file_path, engine='c', **kwargs)
+        except pd.errors.ParserError as parse_e:
+            self.logger.warning(f"C engine failed ({parse_e}); retrying with python engine")
+            return pd.read_csv(self.file_path, engine='python', **kwargs)
+
+    @staticmethod
+    def _arrow_type_label(arrow_type: pa.DataType) -> str:
+        """Map an Arrow type to the coarse type labels used in the UI."""
+        if pa.types.is_integer(arrow_type):
+            return 'integer'
+        if pa.types.is_floating(arrow_type):
+            return 'float'
+        if pa.types.is_boolean(arrow_type):
+            return 'boolean'
+        if pa.types.is_temporal(arrow_type):
+            return 'datetime'
+        return 'string'
+
+    @staticmethod
+    def _dtype_label(dtype) -> str:
+        """Map a pandas/Arrow dtype to the coarse type labels used in the UI."""
+        kind = getattr(dtype, 'kind', None)
+        if kind in ('i', 'u'):
+            return 'integer'
+        if kind == 'f':
+            return 'float'
+        if kind == 'b':
+            return 'boolean'
+        if kind == 'M':
+            return 'datetime'
+        return 'string'
+
+    def _infer_one_column(self, series: pd.Series, non_na_original: int) -> tuple:
+        """
+        Infer the type of a single column without mutating shared state.
+
+        Each candidate type is tried cheapest-first and short-circuits on
+        success, so most columns get a single coercion pass instead of three.
+
+        Args:
+            series: The raw string column.
+            non_na_original: Pre-computed non-NA count for the column.
 
-            # Try to convert to datetime
+        Returns:
+            Tuple of (converted series or None to keep the original, type label).
+        """
+        # Try to convert to numeric
+        numeric_converted = pd.to_numeric(series, errors='coerce')
+        if numeric_converted.notna().sum() / non_na_original > 0.8:  # 80% conversion success
+            if (numeric_converted == numeric_converted.astype('Int64', errors='ignore')).all():
+                return numeric_converted, 'integer'
+            return numeric_converted, 'float'
+
+        # Try to convert to datetime, but only if the first non-null value
+        # even looks like a date — skips the expensive parse for free text
+        first_valid = series.dropna().head(1)
+        looks_like_date = (
+            not first_valid.empty
+            and _DATE_PREFIX_RE.match(str(first_valid.iloc[0])) is not None
+        )
+        if looks_like_date:
             try:
-                datetime_converted = pd.to_datetime(self.df[col], errors='coerce', infer_datetime_format=True)
-                if not datetime_converted.isna().all():
-                    non_na_original = self.df[col].notna().sum()
-                    non_na_converted = datetime_converted.notna().sum()
-
-                    if non_na_converted / max(non_na_original, 1) > 0.8:  # 80% conversion success
-                        self.df[col] = datetime_converted
-                        self._original_dtypes[col] = 'datetime'
-                        continue
+                datetime_converted = pd.to_datetime(series, errors='coerce', format='mixed')
+                if datetime_converted.notna().sum() / non_na_original > 0.8:
+                    return datetime_converted, 'datetime'
             except (ValueError, TypeError):
                 pass
 
-            # Try to convert to boolean
-            bool_values = self.df[col].str.lower().isin(['true', 'false', 't', 'f', '1', '0', 'yes', 'no', 'y', 'n'])
-            if bool_values.sum() / len(self.df[col]) > 0.8:
-                bool_mapping = {
-                    'true': True, 'false': False, 't': True, 'f': False,
-                    '1': True, '0': False, 'yes': True, 'no': False,
-                    'y': True, 'n': False
-                }
-                self.df[col] = self.df[col].str.lower().map(bool_mapping)
-                self._original_dtypes[col] = 'boolean'
-                continue
+        # Try to convert to boolean: categorize against the known token
+        # vocabulary, then one indexed gather — no Python callback per element
+        converted, matched_ratio = self._to_boolean(series)
+        if matched_ratio > 0.8:
+            return converted, 'boolean'
 
-            # Keep as string
-            self._original_dtypes[col] = 'string'
+        # Keep as string
+        return None, 'string'
+
+    @staticmethod
+    def _to_boolean(series: pd.Series) -> tuple:
+        """
+        Convert a string column to booleans via Categorical codes.
+
+        Returns:
+            Tuple of (converted object Series, fraction of values matched).
+        """
+        cat = pd.Categorical(series.str.lower(), categories=_BOOL_CATEGORIES)
+        codes = np.asarray(cat.codes)
+        values = _BOOL_LOOKUP[np.where(codes < 0, 10, codes)]
+        matched_ratio = (codes >= 0).mean() if len(codes) else 0.0
+        return pd.Series(values, index=series.index, dtype=object), matched_ratio
+
+    # Rows used to decide a column's type in the fallback reader; the chosen
+    # conversion is then applied to the full column without re-inference
+    _SCHEMA_SAMPLE_ROWS = 10_000
+
+    def _convert_full_column(self, col, label: str) -> Optional[pd.Series]:
+        """Apply an already-decided type conversion to a full column."""
+        series = self.df[col]
+        if label in ('integer', 'float'):
+            return pd.to_numeric(series, errors='coerce')
+        if label == 'datetime':
+            return pd.to_datetime(series, errors='coerce', format='mixed')
+        if label == 'boolean':
+            return self._to_boolean(series)[0]
+        return None
+
+    def _infer_types(self) -> None:
+        """
+        Infer appropriate data types for columns (pandas fallback path only).
+
+        Types are decided on a head sample, then the chosen conversion is
+        applied to the full column in one pass — no re-inference over the
+        rest of the file. Columns run in parallel: the coercion work happens
+        inside NumPy/pandas C code that releases the GIL.
+        """
+        if self.df is None:
+            return
+
+        sampled = len(self.df) > self._SCHEMA_SAMPLE_ROWS
+        sample_df = self.df.head(self._SCHEMA_SAMPLE_ROWS) if sampled else self.df
+
+        # One vectorized pass instead of a notna().sum() per candidate type
+        non_na_counts = sample_df.notna().sum()
+        columns = list(sample_df.columns)
+
+        def infer_one(col):
+            converted, label = self._infer_one_column(
+                sample_df[col], max(int(non_na_counts[col]), 1)
+            )
+            if sampled and label != 'string':
+                # Sample-derived conversion covers only the head; redo the
+                # conversion (not the inference) over the whole column
+                converted = self._convert_full_column(col, label)
+            return col, converted, label
+
+        if len(columns) > 1:
+            max_workers = min(os.cpu_count() or 1, len(columns))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(infer_one, columns))
+        else:
+            results = [infer_one(col) for col in columns]
+
+        for col, converted, label in results:
+            if converted is not None:
+                self.df[col] = converted
+            self._original_dtypes[col] = label
 
     def close(self) -> None:
         """Close and cleanup resources (CSV data is held in memory)."""
-        if self.df is not None:
+        if self._df is not None or self._head_batch is not None:
             self.logger.info(f"Closed CSV handler for: {self.file_path.name}")
-            self.df = None
+            self._df = None
+            self._head_batch = None
+            self._arrow_table = None
             self._original_dtypes = None
+            self._stats_cache.clear()
+            self._types_summary = None
 
     def get_metadata_summary(self) -> Dict[str, Any]:
         """
@@ -175,12 +559,8 @@ class CsvHandler(DataHandler):
         if self.df is None:
             return {"error": "CSV data not loaded or handler closed."}
 
-        try:
-            file_size = self.file_path.stat().st_size
-            size_str = self.format_size(file_size)
-        except Exception as e:
-            self.logger.warning(f"Could not get file size for {self.file_path}: {e}")
-            size_str = "N/A"
+        file_size = self._get_file_size()
+        size_str = self.format_size(file_size) if file_size is not None else "N/A"
 
         # Create a well-structured metadata summary
         summary = {
@@ -192,18 +572,34 @@ class CsvHandler(DataHandler):
             "Data Structure": {
                 "Total Rows": f"{len(self.df):,}",
                 "Total Columns": f"{len(self.df.columns):,}",
-                "Memory Usage": f"{self.df.memory_usage(deep=True).sum():,} bytes"
+                "Memory Usage": self._estimate_memory_usage()
             },
             "Column Types Summary": self._get_column_types_summary()
         }
 
         return summary
 
+    def _estimate_memory_usage(self) -> str:
+        """
+        In-memory size of the loaded data, without a deep per-cell scan.
+
+        Arrow tracks buffer sizes per chunk, so when the Arrow table is
+        around this is O(chunks); memory_usage(deep=True) would instead walk
+        every Python string in every object column.
+        """
+        if self._arrow_table is not None:
+            return f"{self._arrow_table.nbytes:,} bytes"
+        # Shallow sum; object columns report pointer size only, so tag it
+        return f"{self.df.memory_usage(deep=False).sum():,} bytes (estimated)"
+
     def _get_column_types_summary(self) -> Dict[str, int]:
-        """Get a summary of column types in the CSV data."""
-        if self.df is None or self._original_dtypes is None:
+        """Get a summary of column types in the CSV data (computed once)."""
+        if self._original_dtypes is None:
             return {}
 
+        if self._types_summary is not None:
+            return self._types_summary
+
         type_counts = {}
         for col_type in self._original_dtypes.values():
             type_counts[col_type] = type_counts.get(col_type, 0) + 1
@@ -222,6 +618,7 @@ class CsvHandler(DataHandler):
             label = type_labels.get(type_key, f'{type_key.title()} Columns')
             formatted_summary[label] = f"{count:,}"
 
+        self._types_summary = formatted_summary
         return formatted_summary
 
     def get_schema_data(self) -> Optional[List[Dict[str, Any]]]:
@@ -232,19 +629,31 @@ class CsvHandler(DataHandler):
             A list of dictionaries describing columns (name, type, nullable),
             or None if schema couldn't be determined.
         """
-        if self.df is None:
-            self.logger.warning("DataFrame is not available for schema data")
+        if self._original_dtypes is None:
+            self.logger.warning("Schema data is not available (handler closed?)")
             return None
 
+        # Nullability from the already-parsed data: the full DataFrame when it
+        # has been materialized, otherwise the head batch — checking the head
+        # avoids forcing the full parse just to render the schema tab.
+        if self._df is not None:
+            null_flags = {col: bool(self._df[col].isna().any()) for col in self._df.columns}
+        elif self._head_batch is not None:
+            null_flags = {
+                field.name: self._head_batch.column(i).null_count > 0
+                for i, field in enumerate(self._head_batch.schema)
+            }
+        else:
+            null_flags = {}
+
         schema_list = []
 
-        for col in self.df.columns:
+        for col in self._original_dtypes:
             try:
                 # Get the inferred type
                 col_type = self._original_dtypes.get(col, 'string')
 
-                # Check for null values
-                has_nulls = self.df[col].isna().any()
+                has_nulls = null_flags.get(col, False)
 
                 schema_list.append({
                     "name": str(col),
@@ -273,11 +682,25 @@ class CsvHandler(DataHandler):
             A pandas DataFrame with preview data, an empty DataFrame if no data,
             or a DataFrame with an 'error' column on failure.
         """
-        if self.df is None:
-            self.logger.warning("CSV data not available for preview")
-            return pd.DataFrame({"error": ["CSV data not loaded or handler closed."]})
-
         try:
+            # Serve the preview straight from the head batch when the full
+            # DataFrame hasn't been materialized: memory stays O(num_rows)
+            # instead of O(file), and nothing forces the full parse.
+            if self._df is None and self._head_batch is not None:
+                if self._head_batch.num_rows >= num_rows or self._head_batch_is_whole_file():
+                    preview_df = self._head_batch.slice(0, num_rows).to_pandas(
+                        types_mapper=pd.ArrowDtype
+                    )
+                    self.logger.info(
+                        f"Generated preview of {len(preview_df)} rows from head batch "
+                        f"for {self.file_path.name}"
+                    )
+                    return preview_df
+
+            if self.df is None:
+                self.logger.warning("CSV data not available for preview")
+                return pd.DataFrame({"error": ["CSV data not loaded or handler closed."]})
+
             if self.df.empty:
                 self.logger.info("CSV file has no data rows")
                 return pd.DataFrame(columns=self.df.columns)
@@ -291,6 +714,11 @@ class CsvHandler(DataHandler):
             self.logger.exception(f"Error generating data preview from CSV file: {self.file_path.name}")
             return pd.DataFrame({"error": [f"Failed to generate preview: {e}"]})
 
+    def _head_batch_is_whole_file(self) -> bool:
+        """True if the head batch's block covered the entire file."""
+        size = self._get_file_size()
+        return size is not None and size <= (1 << 20)
+
     def get_column_stats(self, column_name: str) -> Dict[str, Any]:
         """
         Calculate and return statistics for a specific column.
@@ -301,6 +729,12 @@ class CsvHandler(DataHandler):
         Returns:
             A dictionary containing column statistics or error information.
         """
+        # The data never changes after load, so a column's stats are computed
+        # at most once per handler (the UI re-requests them on every selection)
+        cached = self._stats_cache.get(column_name)
+        if cached is not None:
+            return cached
+
         if self.df is None:
             return self._create_stats_result(
                 column_name, "Unknown", {}, error="CSV data not loaded or handler closed."
@@ -311,14 +745,25 @@ class CsvHandler(DataHandler):
                 column_name, "Unknown", {}, error=f"Column '{column_name}' not found in CSV data."
             )
 
+        # Prefer Arrow compute kernels: they scan the table's buffers in C++
+        # (one or two passes, GIL released) instead of pandas' per-statistic
+        # passes over boxed values.
+        if self._arrow_table is not None and column_name in self._arrow_table.column_names:
+            result = self._get_column_stats_arrow(column_name)
+            if result.get("error") is None:
+                self._stats_cache[column_name] = result
+            return result
+
         try:
             col_series = self.df[column_name]
             col_type = self._original_dtypes.get(column_name, 'string')
 
-            # Basic counts
-            total_count = len(col_series)
-            null_count = col_series.isna().sum()
-            valid_count = total_count - null_count
+            # One NA-mask pass feeds the counts and the valid-row selection,
+            # instead of separate isna().sum() and dropna() scans
+            valid_mask = col_series.notna().to_numpy()
+            total_count = valid_mask.shape[0]
+            valid_count = int(valid_mask.sum())
+            null_count = total_count - valid_count
             null_percentage = (null_count / total_count * 100) if total_count > 0 else 0
 
             stats = {
@@ -330,11 +775,12 @@ class CsvHandler(DataHandler):
 
             # Type-specific statistics
             if valid_count > 0:
-                valid_series = col_series.dropna()
+                valid_series = col_series[valid_mask]
 
                 # Distinct count (always applicable)
                 distinct_count = valid_series.nunique()
                 stats["Distinct Count"] = f"{distinct_count:,}"
+                stats["_distinct_count_int"] = int(distinct_count)
 
                 if col_type in ['integer', 'float']:
                     # Numeric statistics
@@ -349,7 +795,9 @@ class CsvHandler(DataHandler):
                     # String statistics (min/max by alphabetical order)
                     stats.update(self._calculate_string_stats_pandas(valid_series))
 
-            return self._create_stats_result(column_name, col_type, stats, nullable=null_count > 0)
+            result = self._create_stats_result(column_name, col_type, stats, nullable=null_count > 0)
+            self._stats_cache[column_name] = result
+            return result
 
         except Exception as e:
             self.logger.exception(f"Error calculating stats for column '{column_name}'")
@@ -357,6 +805,133 @@ class CsvHandler(DataHandler):
                 column_name, "Unknown", {}, error=f"Failed to calculate statistics: {e}"
             )
 
+    def _get_column_stats_arrow(self, column_name: str) -> Dict[str, Any]:
+        """Calculate column statistics with pyarrow.compute kernels."""
+        col_type = self._original_dtypes.get(column_name, 'string')
+
+        try:
+            arr = self._arrow_table.column(column_name)
+
+            total_count = len(arr)
+            null_count = arr.null_count
+            valid_count = total_count - null_count
+            null_percentage = (null_count / total_count * 100) if total_count > 0 else 0
+
+            stats = {
+                "Total Count": f"{total_count:,}",
+                "Valid Count": f"{valid_count:,}",
+                "Null Count": f"{null_count:,}",
+                "Null Percentage": f"{null_percentage:.2f}%"
+            }
+
+            if valid_count > 0:
+                distinct_count = pc.count_distinct(arr).as_py()
+                stats["Distinct Count"] = f"{distinct_count:,}"
+                stats["_distinct_count_int"] = int(distinct_count)
+
+                if col_type in ['integer', 'float']:
+                    stats.update(self._calculate_numeric_stats_arrow(arr))
+                elif col_type == 'datetime':
+                    stats.update(self._calculate_datetime_stats_arrow(arr))
+                elif col_type == 'boolean':
+                    stats.update(self._calculate_boolean_stats_arrow(arr, valid_count))
+                elif col_type == 'string':
+                    stats.update(self._calculate_string_stats_arrow(arr))
+
+            return self._create_stats_result(column_name, col_type, stats, nullable=null_count > 0)
+
+        except Exception as e:
+            self.logger.exception(f"Error calculating Arrow stats for column '{column_name}'")
+            return self._create_stats_result(
+                column_name, col_type, {}, error=f"Failed to calculate statistics: {e}"
+            )
+
+    def _calculate_numeric_stats_arrow(self, arr: pa.ChunkedArray) -> Dict[str, Any]:
+        """Calculate statistics for numeric columns with Arrow kernels."""
+        stats = {}
+        try:
+            mm = pc.min_max(arr)
+            stats["Min"] = mm["min"].as_py()
+            stats["Max"] = mm["max"].as_py()
+            stats["Mean"] = f"{pc.mean(arr).as_py():.4f}"
+            stats["Median (50%)"] = pc.approximate_median(arr).as_py()
+            stats["StdDev"] = f"{pc.stddev(arr, ddof=1).as_py():.4f}"
+
+            # Histogram sample straight from the Arrow buffers, kept as a
+            # float32 ndarray so the renderer skips per-element sanitation
+            sample = arr.drop_null().slice(0, 10000)
+            if len(sample) > 10:
+                stats["_histogram_data"] = sample.to_numpy().astype(np.float32, copy=False)
+                stats["_data_type"] = "numeric"
+
+        except pa.ArrowException as e:
+            self.logger.warning(f"Error calculating numeric stats: {e}")
+            stats["Calculation Error"] = str(e)
+        return stats
+
+    def _calculate_datetime_stats_arrow(self, arr: pa.ChunkedArray) -> Dict[str, Any]:
+        """Calculate statistics for datetime columns with Arrow kernels."""
+        stats = {}
+        try:
+            mm = pc.min_max(arr)
+            min_val = mm["min"].as_py()
+            max_val = mm["max"].as_py()
+            stats["Min"] = min_val
+            stats["Max"] = max_val
+            stats["Range"] = str(max_val - min_val)
+        except pa.ArrowException as e:
+            self.logger.warning(f"Error calculating datetime stats: {e}")
+            stats["Calculation Error"] = str(e)
+        return stats
+
+    def _calculate_boolean_stats_arrow(self, arr: pa.ChunkedArray, valid_count: int) -> Dict[str, Any]:
+        """Calculate statistics for boolean columns with Arrow kernels."""
+        stats = {}
+        try:
+            true_count = pc.sum(arr).as_py() or 0
+            false_count = valid_count - true_count
+            stats["True Count"] = f"{true_count:,}"
+            stats["False Count"] = f"{false_count:,}"
+            if valid_count > 0:
+                stats["True Percentage"] = f"{true_count / valid_count * 100:.2f}%"
+        except pa.ArrowException as e:
+            self.logger.warning(f"Error calculating boolean stats: {e}")
+            stats["Calculation Error"] = str(e)
+        return stats
+
+    def _calculate_string_stats_arrow(self, arr: pa.ChunkedArray) -> Dict[str, Any]:
+        """Calculate statistics for string columns with Arrow kernels."""
+        stats = {}
+        try:
+            # One vectorized min/max scan instead of two lexicographic
+            # pandas passes over boxed Python strings
+            mm = pc.min_max(arr)
+            stats["Min"] = str(mm["min"].as_py())
+            stats["Max"] = str(mm["max"].as_py())
+
+            # Most common values: one hash pass, then a partial sort of the
+            # counts — O(D + k log k) instead of sorting all D distinct values
+            vc = pc.value_counts(arr)
+            counts = vc.field("counts").to_numpy()
+            values = vc.field("values")
+            k = min(6, len(counts))  # one spare slot in case null ranks in the top 5
+            top_idx = np.argpartition(counts, len(counts) - k)[-k:]
+            top_idx = top_idx[np.argsort(counts[top_idx])[::-1]]
+            top_values = {}
+            for i in top_idx:
+                value = values[int(i)].as_py()
+                if value is None:
+                    continue
+                top_values[str(value)] = f"{counts[int(i)]:,}"
+                if len(top_values) == 5:
+                    break
+            if top_values:
+                stats["Top Values"] = top_values
+        except pa.ArrowException as e:
+            self.logger.warning(f"Error calculating string stats: {e}")
+            stats["Calculation Error"] = str(e)
+        return stats
+
     def _calculate_numeric_stats_pandas(self, series: pd.Series) -> Dict[str, Any]:
         """Calculate statistics for numeric columns using pandas."""
         stats = {}
@@ -376,10 +951,11 @@ class CsvHandler(DataHandler):
                 else:
                     sampled_series = series
                 
-                # Convert to list for histogram
-                clean_data = sampled_series.tolist()
-                
-                if len(clean_data) > 10:  # Only create histogram if we have enough data
+                # Hand over a float32 ndarray; NaNs are masked out by the
+                # renderer with np.isfinite
+                clean_data = np.asarray(sampled_series, dtype=np.float32)
+
+                if clean_data.size > 10:  # Only create histogram if we have enough data
                     stats["_histogram_data"] = clean_data
                     stats["_data_type"] = "numeric"
                     
@@ -428,8 +1004,9 @@ class CsvHandler(DataHandler):
             stats["Min"] = str(series.min())
             stats["Max"] = str(series.max())
 
-            # Most common values
-            value_counts = series.value_counts().head(5)
+            # Most common values: nlargest does a partial sort over the
+            # distinct counts instead of ordering all of them
+            value_counts = series.value_counts(sort=False).nlargest(5)
             if len(value_counts) > 0:
                 top_values = {}
                 for value, count in value_counts.items():
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import duckdb
+import numpy as np
 import pandas as pd
 
 from ..base import DataHandler, DataHandlerError
@@ -24,18 +25,21 @@ class JsonHandler(DataHandler):
     """
     DEFAULT_VIEW_NAME = "json_data_view"
 
-    def __init__(self, file_path: Path):
+    __slots__ = ("_db_conn", "_view_name", "_schema", "_row_count")
+
+    def __init__(self, file_path: Path, file_size: Optional[int] = None):
         """
         Initializes the JsonHandler.
 
         Args:
             file_path: Path to the JSON file.
+            file_size: Optional pre-computed file size in bytes from validation.
 
         Raises:
             JsonHandlerError: If the file doesn't exist, isn't a file, or if
                               initialization fails (e.g., DuckDB connection, view creation).
         """
-        super().__init__(file_path)
+        super().__init__(file_path, file_size)
 
         self.file_path = self._validate_file_path(file_path)
         self._db_conn: Optional[duckdb.DuckDBPyConnection] = None
@@ -66,6 +70,7 @@ class JsonHandler(DataHandler):
         """Establishes a connection to an in-memory DuckDB database."""
         try:
             self._db_conn = duckdb.connect(database=':memory:', read_only=False)
+            self._register_finalizer(self._db_conn)
             self.logger.debug("DuckDB in-memory connection established.")
         except Exception as e:
             self.logger.exception("Failed to initialize DuckDB connection.")
@@ -180,11 +185,8 @@ class JsonHandler(DataHandler):
             "Total Rows": row_count_str,
             "Columns": columns_str,
         }
-        try:
-            summary["Size"] = f"{self.file_path.stat().st_size:,} bytes"
-        except Exception as e:
-            self.logger.warning(f"Could not get file size for {self.file_path}: {e}")
-            summary["Size"] = "N/A"
+        file_size = self._get_file_size()
+        summary["Size"] = f"{file_size:,} bytes" if file_size is not None else "N/A"
 
         return summary
 
@@ -385,7 +387,9 @@ class JsonHandler(DataHandler):
 
         # Distinct Count
         if 'distinct' in summarize_row and pd.notna(summarize_row['distinct']):
-            stats["Distinct Count"] = f"{int(summarize_row['distinct']):,}"
+            distinct_count = int(summarize_row['distinct'])
+            stats["Distinct Count"] = f"{distinct_count:,}"
+            stats["_distinct_count_int"] = distinct_count
 
         # Numeric Stats
         if 'min' in summarize_row and pd.notna(summarize_row['min']):
@@ -430,10 +434,13 @@ class JsonHandler(DataHandler):
                 # Extract the column data
                 column_data = sample_df.iloc[:, 0].tolist()
 
-                # Filter out any remaining nulls
-                clean_data = [val for val in column_data if val is not None]
+                # Filter out any remaining nulls and pack into a float32
+                # ndarray so the renderer skips per-element sanitation
+                clean_data = np.asarray(
+                    [val for val in column_data if val is not None], dtype=np.float32
+                )
 
-                if len(clean_data) > 10:
+                if clean_data.size > 10:
                     stats["_histogram_data"] = clean_data
                     stats["_data_type"] = "numeric"
 
@@ -472,6 +479,8 @@ class JsonHandler(DataHandler):
                 # Log error but don't raise during close typically
                 self.logger.error(f"Error closing DuckDB connection for {self.file_path}: {e}")
                 self._db_conn = None  # Assume closed even if error occurred
+            finally:
+                self._detach_finalizer()
 
     def __enter__(self):
         """Enter context management."""
@@ -480,7 +489,3 @@ class JsonHandler(DataHandler):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context management, ensuring connection closure."""
         self.close()
-
-    def __del__(self):
-        """Ensures connection is closed when object is garbage collected (best effort)."""
-        self.close()
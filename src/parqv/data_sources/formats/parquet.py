@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional, Union
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -22,30 +23,38 @@ class ParquetHandler(DataHandler):
     Manages the Parquet file resource lifecycle.
     """
 
-    def __init__(self, file_path: Path):
+    __slots__ = ("pq_file", "schema", "metadata")
+
+    # A ParquetHandler only holds a file reader and parsed footer, so reusing
+    # an open instance for an unchanged file is safe and skips the footer parse.
+    CACHEABLE = True
+
+    def __init__(self, file_path: Path, file_size: Optional[int] = None):
         """
         Initializes the ParquetHandler by validating the path and opening the Parquet file.
 
         Args:
             file_path: Path to the Parquet file.
+            file_size: Optional pre-computed file size in bytes from validation.
 
         Raises:
             ParquetHandlerError: If the file is not found, not a file, or cannot be opened/read.
         """
-        super().__init__(file_path)
+        super().__init__(file_path, file_size)
         self.pq_file: Optional[pq.ParquetFile] = None
         self.schema: Optional[pa.Schema] = None
         self.metadata: Optional[pq.FileMetaData] = None
 
         try:
-            # Validate file existence using the path stored by the base class
-            if not self.file_path.is_file():
+            # Validate file existence (skipped when the caller already stat'ed the file)
+            if self.file_size is None and not self.file_path.is_file():
                 raise FileNotFoundError(f"Parquet file not found or is not a file: {self.file_path}")
 
             # Open the Parquet file
             self.pq_file = pq.ParquetFile(self.file_path)
             self.schema = self.pq_file.schema_arrow
             self.metadata = self.pq_file.metadata
+            self._register_finalizer(self.pq_file)
             self.logger.info(f"Successfully initialized ParquetHandler for: {self.file_path.name}")
 
         except FileNotFoundError as fnf_e:
@@ -76,6 +85,7 @@ class ParquetHandler(DataHandler):
                 self.pq_file = None
                 self.schema = None
                 self.metadata = None
+                self._detach_finalizer()
 
     def __enter__(self):
         """Enter the runtime context related to this object."""
@@ -87,10 +97,6 @@ class ParquetHandler(DataHandler):
         """Exit the runtime context related to this object, ensuring cleanup."""
         self.close()
 
-    def __del__(self):
-        """Attempt to close the file when the object is garbage collected (best effort)."""
-        self.close()
-
     def get_metadata_summary(self) -> Dict[str, Any]:
         """
         Provides a summary dictionary of the Parquet file's metadata.
@@ -104,11 +110,11 @@ class ParquetHandler(DataHandler):
 
         try:
             created_by = self._decode_metadata_bytes(self.metadata.created_by) or "N/A"
-            file_size = self.file_path.stat().st_size
+            file_size = self._get_file_size()
             summary = {
                 "File Path": str(self.file_path.resolve()),
                 "Format": "Parquet",
-                "Size": self._format_size(file_size),
+                "Size": self._format_size(file_size) if file_size is not None else "N/A",
                 "Total Rows": f"{self.metadata.num_rows:,}",
                 "Row Groups": self.metadata.num_row_groups,
                 "Columns": self.metadata.num_columns,
@@ -425,6 +431,8 @@ class ParquetHandler(DataHandler):
                     err_var or "N/A")
         distinct_val, err = self._safe_compute(pc.count_distinct, column_data)
         stats["Distinct Count"] = f"{distinct_val:,}" if distinct_val is not None and err is None else (err or "N/A")
+        if distinct_val is not None and err is None:
+            stats["_distinct_count_int"] = int(distinct_val)
 
         # Add histogram data for visualization
         try:
@@ -440,10 +448,13 @@ class ParquetHandler(DataHandler):
             else:
                 sampled_data = column_data.to_pylist()
 
-            # Filter out None values
-            clean_data = [val for val in sampled_data if val is not None]
+            # Filter out None values and pack into a float32 ndarray so the
+            # renderer skips per-element sanitation
+            clean_data = np.asarray(
+                [val for val in sampled_data if val is not None], dtype=np.float32
+            )
 
-            if len(clean_data) > 10:  # Only create histogram if we have enough data
+            if clean_data.size > 10:  # Only create histogram if we have enough data
                 stats["_histogram_data"] = clean_data
                 stats["_data_type"] = "numeric"
 
@@ -19,6 +19,12 @@ class BaseView(Container):
     and handler access.
     """
 
+    # Subclasses set this to defer load_content until they decide to run it
+    # (e.g. on first show) instead of eagerly on mount. Gating here matters:
+    # Textual dispatches on_mount for every class in the MRO, so a subclass
+    # override would not suppress this one.
+    LAZY_LOAD = False
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._is_mounted = False
@@ -38,7 +44,8 @@ class BaseView(Container):
     def on_mount(self) -> None:
         """Called when the view is mounted."""
         self._is_mounted = True
-        self.load_content()
+        if not self.LAZY_LOAD:
+            self.load_content()
 
     def load_content(self) -> None:
         """
@@ -52,7 +59,9 @@ class BaseView(Container):
     def clear_content(self) -> None:
         """Clear all content from the view."""
         try:
-            self.query("*").remove()
+            # Detach the immediate children in one batch rather than querying
+            # (and individually removing) every descendant in the subtree
+            self.remove_children()
         except Exception as e:
             self.logger.error(f"Error clearing content: {e}")
 
@@ -8,9 +8,9 @@ import pandas as pd
 from textual.containers import Container
 from textual.widgets import DataTable, Static
 
-from ...core import get_logger
+from ...core import get_lazy_logger
 
-log = get_logger(__name__)
+log = get_lazy_logger(__name__)
 
 
 class EnhancedDataTable(Container):
@@ -21,6 +21,9 @@ class EnhancedDataTable(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._table: Optional[DataTable] = None
+        # Last mounted empty/error notice, so it can be removed directly
+        # instead of re-querying the subtree for Static widgets
+        self._notice: Optional[Static] = None
     
     def compose(self):
         """Compose the data table layout."""
@@ -118,32 +121,42 @@ class EnhancedDataTable(Container):
         Returns:
             List of tuples representing table rows
         """
-        rows_data = []
-        for row in df.itertuples(index=False, name=None):
-            # Convert each item to string, handling NaN values
-            row_strings = tuple(
-                str(item) if pd.notna(item) else "" 
-                for item in row
-            )
-            rows_data.append(row_strings)
-        return rows_data
+        # Stringify and blank out NA values in two DataFrame-level operations
+        # so all per-cell work happens in C; Python only walks the final rows.
+        values = df.astype(str).to_numpy()
+        na_mask = df.isna().to_numpy()
+        if na_mask.any():
+            values[na_mask] = ""
+        return list(map(tuple, values.tolist()))
     
+    def _remove_notice(self) -> None:
+        """Remove the previously mounted notice widget, if any."""
+        if self._notice is not None:
+            try:
+                self._notice.remove()
+            except Exception as e:
+                log.debug(f"Could not remove previous notice: {e}")
+            self._notice = None
+
     def _show_empty_message(self) -> None:
         """Show a message when the DataFrame is empty."""
         try:
-            self.query("Static").remove()  # Remove any existing messages
-            empty_msg = Static("No data available in the selected range or file is empty.", 
-                             classes="info-content")
-            self.mount(empty_msg)
+            self._remove_notice()
+            self._notice = Static("No data available in the selected range or file is empty.",
+                                  classes="info-content")
+            self.mount(self._notice)
         except Exception as e:
             log.error(f"Failed to show empty message: {e}")
-    
+
     def _show_error_message(self, message: str) -> None:
         """Show an error message in the table area."""
         try:
-            self.query("DataTable, Static").remove()  # Remove table and any messages
-            error_msg = Static(f"[red]{message}[/red]", classes="error-content")
-            self.mount(error_msg)
+            self._remove_notice()
+            if self._table:
+                self._table.remove()
+                self._table = None
+            self._notice = Static(f"[red]{message}[/red]", classes="error-content")
+            self.mount(self._notice)
         except Exception as e:
             log.error(f"Failed to show error message: {e}")
     
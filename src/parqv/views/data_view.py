@@ -2,7 +2,7 @@
 Data view for displaying tabular data preview.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 import pandas as pd
 from textual.app import ComposeResult
@@ -20,6 +20,9 @@ class DataView(BaseView):
     with proper error handling and loading states.
     """
 
+    # Bound on the per-row-count preview cache below
+    PREVIEW_CACHE_SIZE = 4
+
     def __init__(self, preview_rows: int = DEFAULT_PREVIEW_ROWS, **kwargs):
         """
         Initialize the data view.
@@ -31,6 +34,21 @@ class DataView(BaseView):
         super().__init__(**kwargs)
         self.preview_rows = preview_rows
         self._data_table: Optional[EnhancedDataTable] = None
+        # Pull-through cache over handler.get_data_preview keyed by row
+        # count, so load_content and get_current_data (and row-count
+        # toggles) don't repeat the handler I/O; cleared on refresh
+        self._preview_cache: Dict[int, pd.DataFrame] = {}
+
+    def _preview(self, num_rows: int) -> Optional[pd.DataFrame]:
+        """Fetch a data preview through the per-row-count cache."""
+        df = self._preview_cache.get(num_rows)
+        if df is None:
+            df = self.handler.get_data_preview(num_rows=num_rows)
+            if df is not None:
+                self._preview_cache[num_rows] = df
+                while len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+                    self._preview_cache.pop(next(iter(self._preview_cache)))
+        return df
 
     def compose(self) -> ComposeResult:
         """Compose the data view layout."""
@@ -49,7 +67,7 @@ class DataView(BaseView):
         try:
             # Get data preview from handler
             self.logger.info(f"Loading data preview ({self.preview_rows} rows)")
-            df = self.handler.get_data_preview(num_rows=self.preview_rows)
+            df = self._preview(self.preview_rows)
 
             # Validate DataFrame
             if df is None:
@@ -83,11 +101,10 @@ class DataView(BaseView):
         Returns:
             True if the DataFrame contains error information
         """
-        return (
-                not df.empty and
-                "error" in df.columns and
-                len(df.columns) == 1
-        )
+        # Cheap O(1) column checks first; df.empty (which inspects the axes)
+        # only runs for the rare single-"error"-column shape
+        cols = df.columns
+        return len(cols) == 1 and cols[0] == "error" and not df.empty
 
     def _extract_error_from_dataframe(self, df: pd.DataFrame) -> str:
         """
@@ -108,6 +125,7 @@ class DataView(BaseView):
 
     def refresh_data(self) -> None:
         """Refresh the data display."""
+        self._preview_cache.clear()
         self.clear_content()
         self.load_content()
 
@@ -135,7 +153,7 @@ class DataView(BaseView):
             return None
 
         try:
-            return self.handler.get_data_preview(num_rows=self.preview_rows)
+            return self._preview(self.preview_rows)
         except Exception as e:
             self.logger.error(f"Failed to get current data: {e}")
             return None
@@ -2,6 +2,8 @@
 Metadata view for displaying file metadata information.
 """
 
+from typing import Optional
+
 from textual.containers import VerticalScroll
 from textual.widgets import Pretty
 
@@ -17,31 +19,53 @@ class MetadataView(BaseView):
     Shows file statistics, format information, and other metadata
     in a formatted display.
     """
-    
+
+    # Metadata is fetched on first show rather than on mount, so a pane the
+    # user never opens costs nothing
+    LAZY_LOAD = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._loaded = False
+        # Mounted once and updated in place on refresh; remounting a Pretty
+        # costs a renderable rebuild plus a layout pass
+        self._pretty: Optional[Pretty] = None
+
+    def on_show(self) -> None:
+        """Load metadata the first time the pane becomes visible."""
+        if not self._loaded:
+            self._loaded = True
+            self.load_content()
+
     def load_content(self) -> None:
-        """Load and display metadata content."""
+        """Kick off metadata loading on a background worker."""
         if not self.check_handler_available():
             return
-        
+
+        # Fetch + format off the UI thread; Parquet footer parsing or a CSV
+        # row count can take a while and shouldn't stall the render loop.
+        self.run_worker(self._fetch_metadata, thread=True, exclusive=True)
+
+    def _fetch_metadata(self) -> None:
+        """Worker: fetch and format metadata, then hand off to the UI thread."""
         try:
-            # Get raw metadata from handler
             raw_metadata = self.handler.get_metadata_summary()
-            
-            # Format metadata for display
             formatted_metadata = format_metadata_for_display(raw_metadata)
-            
-            # Check if there's an error in the formatted data
-            if "Error" in formatted_metadata and len(formatted_metadata) == 1:
-                self.show_error(formatted_metadata["Error"])
-                return
-            
-            # Display the formatted metadata
-            self._display_metadata(formatted_metadata)
-            
-            self.logger.info("Metadata loaded successfully")
-            
         except Exception as e:
-            self.show_error("Failed to load metadata", e)
+            self.app.call_from_thread(self.show_error, "Failed to load metadata", e)
+            return
+
+        self.app.call_from_thread(self._on_metadata_ready, formatted_metadata)
+
+    def _on_metadata_ready(self, formatted_metadata: dict) -> None:
+        """Display the formatted metadata once the worker completes."""
+        # Check if there's an error in the formatted data
+        if "Error" in formatted_metadata and len(formatted_metadata) == 1:
+            self.show_error(formatted_metadata["Error"])
+            return
+
+        self._display_metadata(formatted_metadata)
+        self.logger.info("Metadata loaded successfully")
     
     def _display_metadata(self, metadata: dict) -> None:
         """
@@ -51,13 +75,19 @@ class MetadataView(BaseView):
             metadata: Formatted metadata dictionary
         """
         try:
-            pretty_widget = Pretty(metadata, id="metadata-pretty")
-            self.mount(pretty_widget)
+            if self._pretty is not None and self._pretty.parent is self:
+                self._pretty.update(metadata)
+            else:
+                # Drop any stale content (e.g. a previous error display)
+                # before mounting the fresh widget
+                self.clear_content()
+                self._pretty = Pretty(metadata, id="metadata-pretty")
+                self.mount(self._pretty)
         except Exception as e:
             self.logger.error(f"Failed to create Pretty widget: {e}")
             self.show_error("Failed to display metadata")
     
     def refresh_metadata(self) -> None:
-        """Refresh the metadata display."""
-        self.clear_content()
+        """Refresh the metadata display, updating the Pretty in place."""
+        self._loaded = True
         self.load_content()
\ No newline at end of file
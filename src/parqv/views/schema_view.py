@@ -2,6 +2,10 @@
 Schema view for displaying column schema and statistics.
 """
 
+import asyncio
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 
 from rich.text import Text
@@ -14,16 +18,39 @@ from .base import BaseView
 from .utils import format_stats_for_display
 
 
+_UNSAFE_ID_CHARS = re.compile(r"[^A-Za-z0-9]")
+
+
+@lru_cache(maxsize=4096)
+def _safe_id(column_name: str) -> str:
+    """Sanitize a column name into a CSS-safe widget id fragment.
+
+    One regex pass in C instead of a per-character Python loop, cached
+    because the same names recur on every refresh_schema.
+    """
+    return _UNSAFE_ID_CHARS.sub("_", column_name)
+
+
 class ColumnListItem(ListItem):
     """A ListItem that stores the column name for schema display."""
 
     def __init__(self, column_name: str) -> None:
         # Ensure IDs are CSS-safe (replace spaces, etc.)
-        safe_id_name = "".join(c if c.isalnum() else '_' for c in column_name)
-        super().__init__(Label(column_name), name=column_name, id=f"col-item-{safe_id_name}")
+        super().__init__(Label(column_name), name=column_name, id=f"col-item-{_safe_id(column_name)}")
         self.column_name = column_name
 
 
+class LoadMoreItem(ListItem):
+    """Placeholder item that mounts the next window of columns when selected.
+
+    Deliberately id-less: the old placeholder's removal is scheduled, not
+    immediate, so a fixed id would collide with its replacement.
+    """
+
+    def __init__(self, remaining: int) -> None:
+        super().__init__(Label(f"[dim]… load more ({remaining:,} remaining)[/dim]"))
+
+
 class SchemaView(BaseView):
     """
     View for displaying schema information and column statistics.
@@ -37,10 +64,30 @@ class SchemaView(BaseView):
     # Reactive variable for loading state
     loading = var(False)
 
+    # Bound on the per-column stats LRU below
+    STATS_CACHE_SIZE = 64
+
+    # Columns mounted per batch; very wide schemas (1000s of columns) get a
+    # "load more" item instead of one widget per column up front
+    MAX_COLUMN_ITEMS = 500
+
+    # Stats lists longer than two batches are mounted progressively so the
+    # first screenful appears before the rest (e.g. huge Value Counts)
+    MOUNT_BATCH_SIZE = 32
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._columns_data: Optional[List[Dict[str, Any]]] = None
+        self._column_names: List[str] = []
+        self._columns_mounted: int = 0
         self._current_column: Optional[str] = None
+        # LRU of formatted stats lines keyed by column name, so revisiting
+        # a column skips the handler's column scan entirely
+        self._stats_cache: "OrderedDict[str, List]" = OrderedDict()
+        # Statics currently mounted in the stats area, reused via update()
+        # on column switches instead of a remove-all/remount cycle
+        self._mounted_stat_widgets: List[Static] = []
+        self._mounted_stat_classes: str = ""
 
     def compose(self) -> ComposeResult:
         """Compose the schema view layout."""
@@ -78,7 +125,8 @@ class SchemaView(BaseView):
         """Load the list of columns from the data handler."""
         try:
             list_view = self.query_one("#column-list-view", ListView)
-            list_view.clear()
+            if list_view.children:
+                list_view.clear()
 
             # Get schema data from handler
             self._columns_data = self.handler.get_schema_data()
@@ -92,27 +140,49 @@ class SchemaView(BaseView):
                 self._show_list_warning("Schema has no columns")
                 return
 
-            # Populate column list
-            column_count = 0
+            self._column_names = []
+            self._columns_mounted = 0
             for col_info in self._columns_data:
                 column_name = col_info.get("name")
                 if column_name:
-                    list_view.append(ColumnListItem(column_name))
-                    column_count += 1
+                    self._column_names.append(column_name)
                 else:
                     self.logger.warning("Found column info without a 'name' key")
 
-            self.logger.info(f"Populated column list with {column_count} columns")
+            self._append_column_batch(list_view)
+
+            self.logger.info(
+                f"Populated column list with {self._columns_mounted} of "
+                f"{len(self._column_names)} columns"
+            )
 
         except Exception as e:
             self.logger.exception("Error loading column list")
             self._show_list_error(f"Error loading schema: {e}")
 
+    def _append_column_batch(self, list_view: ListView) -> None:
+        """
+        Mount the next window of column items in one extend() call.
+
+        Caps the widget tree at MAX_COLUMN_ITEMS per batch; when more
+        columns remain, a single "load more" item stands in for the rest.
+        """
+        start = self._columns_mounted
+        end = min(start + self.MAX_COLUMN_ITEMS, len(self._column_names))
+        items: List[ListItem] = [ColumnListItem(name) for name in self._column_names[start:end]]
+        self._columns_mounted = end
+
+        remaining = len(self._column_names) - end
+        if remaining > 0:
+            items.append(LoadMoreItem(remaining))
+        list_view.extend(items)
+
     def _show_list_error(self, message: str) -> None:
         """Show error message in the column list."""
         try:
             list_view = self.query_one("#column-list-view", ListView)
-            list_view.clear()
+            if list_view.children:
+                list_view.clear()
             list_view.append(ListItem(Label(f"[red]{message}[/red]")))
         except Exception as e:
             self.logger.error(f"Failed to show list error: {e}")
@@ -121,7 +191,8 @@ class SchemaView(BaseView):
         """Show warning message in the column list."""
         try:
             list_view = self.query_one("#column-list-view", ListView)
-            list_view.clear()
+            if list_view.children:
+                list_view.clear()
             list_view.append(ListItem(Label(f"[yellow]{message}[/yellow]")))
         except Exception as e:
             self.logger.error(f"Failed to show list warning: {e}")
@@ -129,14 +200,76 @@ class SchemaView(BaseView):
     def _display_default_message(self) -> None:
         """Display the initial message in the stats area."""
         try:
-            stats_container = self.query_one("#schema-stats-content", Container)
-            stats_container.query("*").remove()
-            stats_container.mount(Static(self.DEFAULT_STATS_MESSAGE, classes="stats-line"))
+            self._set_stats_content([self.DEFAULT_STATS_MESSAGE])
         except Exception as e:
             self.logger.error(f"Failed to display default stats message: {e}")
 
+    def _set_stats_content(self, renderables: List, classes: str = "stats-line") -> None:
+        """
+        Replace the stats area content with the given renderables.
+
+        When the number of lines (and their CSS classes) matches what is
+        already mounted, the existing Static widgets are updated in place,
+        skipping the remove/remount churn on every column switch.
+        """
+        # Stop any in-flight progressive mount: starting another long list
+        # cancels it via exclusive=True, but the direct-mount and
+        # update-in-place paths would otherwise let stale batches keep
+        # landing after remove_children()
+        self.workers.cancel_group(self, "stats-mount")
+
+        stats_container = self.query_one("#schema-stats-content", Container)
+        mounted = self._mounted_stat_widgets
+
+        # Tracking is only trusted while the widgets are still attached here
+        # (clear_content/refresh detaches them behind our back)
+        if mounted and mounted[0].parent is not stats_container:
+            mounted = self._mounted_stat_widgets = []
+
+        if len(mounted) == len(renderables) and self._mounted_stat_classes == classes:
+            for widget, renderable in zip(mounted, renderables):
+                widget.update(renderable)
+            return
+
+        stats_container.remove_children()
+        self._mounted_stat_classes = classes
+
+        if len(renderables) > self.MOUNT_BATCH_SIZE * 2:
+            # Long lists stream in batch-sized chunks from a worker so the
+            # user sees the first lines immediately; exclusive cancels an
+            # in-flight mount when the user hops to another column
+            self._mounted_stat_widgets = []
+            self.run_worker(
+                self._mount_stats_progressively(stats_container, renderables, classes),
+                exclusive=True,
+                group="stats-mount",
+            )
+            return
+
+        widgets = [Static(renderable, classes=classes) for renderable in renderables]
+        stats_container.mount(*widgets)
+        self._mounted_stat_widgets = widgets
+
+    async def _mount_stats_progressively(
+            self, stats_container: Container, renderables: List, classes: str
+    ) -> None:
+        """Mount stats lines in MOUNT_BATCH_SIZE chunks, yielding between them."""
+        for start in range(0, len(renderables), self.MOUNT_BATCH_SIZE):
+            batch = [
+                Static(renderable, classes=classes)
+                for renderable in renderables[start:start + self.MOUNT_BATCH_SIZE]
+            ]
+            stats_container.mount(*batch)
+            self._mounted_stat_widgets.extend(batch)
+            await asyncio.sleep(0)
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle column selection from the list."""
+        if isinstance(event.item, LoadMoreItem):
+            event.item.remove()
+            self._append_column_batch(event.list_view)
+            return
+
         if hasattr(event.item, 'column_name'):
             column_name = event.item.column_name
             self._current_column = column_name
@@ -147,7 +280,11 @@ class SchemaView(BaseView):
     def _load_column_stats(self, column_name: str) -> None:
         """
         Load and display statistics for the selected column.
-        
+
+        The stats computation runs on a background worker so a slow column
+        scan doesn't freeze the UI; exclusive=True cancels any in-flight
+        fetch when the user hops to another column.
+
         Args:
             column_name: Name of the column to analyze
         """
@@ -155,25 +292,60 @@ class SchemaView(BaseView):
             self._show_stats_error("Data handler not available")
             return
 
-        try:
-            # Set loading state
-            self.loading = True
+        cached_lines = self._stats_cache.get(column_name)
+        if cached_lines is not None:
+            self._stats_cache.move_to_end(column_name)
+            self._display_column_stats(cached_lines)
+            # An earlier selection may have left the indicator up; its
+            # worker's stale result no longer clears it (see _on_stats_ready)
+            self.loading = False
+            return
 
-            # Get column statistics
-            self.logger.debug(f"Loading stats for column: {column_name}")
+        self.loading = True
+        self.logger.debug(f"Loading stats for column: {column_name}")
+        self.run_worker(
+            lambda: self._fetch_column_stats(column_name),
+            thread=True,
+            exclusive=True,
+            group="column-stats",
+        )
+
+    def _fetch_column_stats(self, column_name: str) -> None:
+        """Worker: compute and format column stats, then hand off to the UI thread."""
+        try:
             raw_stats = self.handler.get_column_stats(column_name)
-
-            # Format stats for display
             formatted_lines = format_stats_for_display(raw_stats)
-
-            # Display the formatted stats
-            self._display_column_stats(formatted_lines)
-
         except Exception as e:
             self.logger.exception(f"Error loading stats for column {column_name}")
-            self._show_stats_error(f"Failed to load statistics: {e}")
-        finally:
-            self.loading = False
+            self.app.call_from_thread(
+                self._on_stats_error, column_name, f"Failed to load statistics: {e}"
+            )
+            return
+
+        self.app.call_from_thread(self._on_stats_ready, column_name, formatted_lines)
+
+    def _on_stats_ready(self, column_name: str, formatted_lines: List) -> None:
+        """Display fetched stats, cache them, and clear the loading state.
+
+        A cancelled thread worker still runs to completion and its
+        call_from_thread fires, so a stale result for a previously
+        selected column can land after the user has moved on — cache it,
+        but leave the display and loading state alone.
+        """
+        self._stats_cache[column_name] = formatted_lines
+        while len(self._stats_cache) > self.STATS_CACHE_SIZE:
+            self._stats_cache.popitem(last=False)
+        if column_name != self._current_column:
+            return
+        self._display_column_stats(formatted_lines)
+        self.loading = False
+
+    def _on_stats_error(self, column_name: str, message: str) -> None:
+        """Show a stats error and clear the loading state, unless stale."""
+        if column_name != self._current_column:
+            return
+        self._show_stats_error(message)
+        self.loading = False
 
     def _display_column_stats(self, formatted_lines: List) -> None:
         """
@@ -183,15 +355,9 @@ class SchemaView(BaseView):
             formatted_lines: List of formatted text lines to display
         """
         try:
-            stats_container = self.query_one("#schema-stats-content", Container)
-            stats_container.query("*").remove()
-
-            for line in formatted_lines:
-                if isinstance(line, Text):
-                    stats_container.mount(Static(line, classes="stats-line"))
-                else:
-                    stats_container.mount(Static(str(line), classes="stats-line"))
-
+            self._set_stats_content(
+                [line if isinstance(line, Text) else str(line) for line in formatted_lines]
+            )
         except Exception as e:
             self.logger.error(f"Failed to display column stats: {e}")
             self._show_stats_error("Failed to display statistics")
@@ -199,9 +365,7 @@ class SchemaView(BaseView):
     def _show_stats_error(self, message: str) -> None:
         """Show error message in the stats area."""
         try:
-            stats_container = self.query_one("#schema-stats-content", Container)
-            stats_container.query("*").remove()
-            stats_container.mount(Static(f"[red]Error: {message}[/red]", classes="error-content"))
+            self._set_stats_content([f"[red]Error: {message}[/red]"], classes="error-content")
         except Exception as e:
             self.logger.error(f"Failed to show stats error: {e}")
 
@@ -224,6 +388,7 @@ class SchemaView(BaseView):
     def refresh_schema(self) -> None:
         """Refresh the schema display."""
         self._current_column = None
+        self._stats_cache.clear()
         self.clear_content()
         self.load_content()
 
@@ -2,9 +2,37 @@
 Data formatting utilities for parqv views.
 """
 
-from typing import Any, Dict, Union
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
 from rich.text import Text
 
+# Matches size strings that already carry a unit ("59.8 KB", "1,234 bytes")
+_SIZE_UNIT_RE = re.compile(r"\b(?:kb|mb|gb|tb|bytes)\b", re.IGNORECASE)
+
+# Exact-type dispatch for the common scalar cases: one dict probe on
+# type(value) instead of cascaded isinstance checks. Keying by type also
+# keeps bool out of the numeric path (type(True) is bool, not int), which
+# the old isinstance cascade got wrong.
+_FMT_BY_TYPE = {
+    int: lambda v: f"{v:,}",
+    float: lambda v: f"{v:,.2f}",
+    bool: lambda v: "Yes" if v else "No",
+}
+
+# Formatting is a pure function of the metadata dict; toggling tabs re-sends
+# the same dict, so a small LRU skips the repeat pass
+_METADATA_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_METADATA_CACHE_SIZE = 32
+
+
+def _metadata_cache_key(metadata: Dict[str, Any]) -> Optional[Tuple]:
+    """Build a hashable key for a metadata dict, or None if it can't be keyed."""
+    try:
+        return tuple(sorted((k, str(v)) for k, v in metadata.items()))
+    except (TypeError, ValueError):
+        return None
+
 
 def format_metadata_for_display(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -22,47 +50,44 @@ def format_metadata_for_display(metadata: Dict[str, Any]) -> Dict[str, Any]:
     # Check for error in metadata
     if "error" in metadata:
         return {"Error": metadata["error"]}
-    
+
+    cache_key = _metadata_cache_key(metadata)
+    if cache_key is not None:
+        cached = _METADATA_CACHE.get(cache_key)
+        if cached is not None:
+            _METADATA_CACHE.move_to_end(cache_key)
+            return cached
+
     formatted = {}
-    
-    # Format specific known fields with better presentation
-    field_formatters = {
-        "File Path": lambda x: str(x),
-        "Path": lambda x: str(x),
-        "Format": lambda x: str(x).upper(),
-        "Total Rows": lambda x: _format_number(x),
-        "Total Columns": lambda x: _format_number(x),
-        "Columns": lambda x: _format_number(x),
-        "Size": lambda x: _format_size_if_bytes(x),
-        "Memory Usage": lambda x: _format_size_if_bytes(x),
-        "DuckDB View": lambda x: f"`{x}`" if x else "N/A",
-    }
-    
+
     for key, value in metadata.items():
         if isinstance(value, dict):
             # Handle nested dictionaries (like grouped metadata)
-            formatted[key] = _format_nested_metadata(value, field_formatters)
-        elif key in field_formatters:
-            formatted[key] = field_formatters[key](value)
+            formatted[key] = _format_nested_metadata(value)
         else:
-            formatted[key] = format_value_for_display(value)
-    
+            # Single dict probe picks the field-specific formatter or the
+            # generic fallback; the table is built once at import
+            formatted[key] = _FIELD_FORMATTERS.get(key, format_value_for_display)(value)
+
+    if cache_key is not None:
+        _METADATA_CACHE[cache_key] = formatted
+        while len(_METADATA_CACHE) > _METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+
     return formatted
 
 
-def _format_nested_metadata(nested_dict: Dict[str, Any], field_formatters: Dict) -> Dict[str, Any]:
+def _format_nested_metadata(nested_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Format nested metadata dictionaries."""
     formatted_nested = {}
-    
+
     for key, value in nested_dict.items():
         if isinstance(value, dict):
             # Handle further nesting if needed
-            formatted_nested[key] = _format_nested_metadata(value, field_formatters)
-        elif key in field_formatters:
-            formatted_nested[key] = field_formatters[key](value)
+            formatted_nested[key] = _format_nested_metadata(value)
         else:
-            formatted_nested[key] = format_value_for_display(value)
-    
+            formatted_nested[key] = _FIELD_FORMATTERS.get(key, format_value_for_display)(value)
+
     return formatted_nested
 
 
@@ -78,13 +103,11 @@ def format_value_for_display(value: Any) -> str:
     """
     if value is None:
         return "N/A"
-    
-    if isinstance(value, (int, float)):
-        return _format_number(value)
-    
-    if isinstance(value, bool):
-        return "Yes" if value else "No"
-    
+
+    formatter = _FMT_BY_TYPE.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
     if isinstance(value, str):
         # Handle empty strings
         if not value.strip():
@@ -118,13 +141,11 @@ def _format_number(value: Union[str, int, float]) -> str:
                 return value  # Return as-is if not numeric
         except (ValueError, AttributeError):
             return value
-    
-    if isinstance(value, int):
-        return f"{value:,}"
-    
-    if isinstance(value, float):
-        return f"{value:,.2f}"
-    
+
+    formatter = _FMT_BY_TYPE.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
     return str(value)
 
 
@@ -138,29 +159,25 @@ def _format_size_if_bytes(value: Union[str, int]) -> str:
     Returns:
         Formatted size string
     """
+    # Well-behaved handlers hand over a raw int byte count; take that path
+    # before any string scanning
+    if isinstance(value, int):
+        # Assume it's bytes if it's a large integer
+        return _format_bytes(value) if value > 1024 else f"{value:,}"
+
     if isinstance(value, str):
-        # If it already contains size units, return as-is
-        if any(unit in value.lower() for unit in ["kb", "mb", "gb", "tb", "bytes"]):
+        # Already carries a unit: one pre-compiled scan instead of five
+        # substring checks, each over a freshly lowered copy
+        if _SIZE_UNIT_RE.search(value):
             return value
-        
-        # Try to parse as number and format as bytes
+
+        # Bare numeric strings get the same treatment as raw int byte counts
         try:
-            clean_str = value.replace(",", "").strip()
-            if "bytes" in value.lower():
-                num_bytes = int(clean_str.split()[0])
-                return _format_bytes(num_bytes)
-            else:
-                return value
-        except (ValueError, IndexError):
+            num_bytes = int(value.replace(",", "").strip())
+        except ValueError:
             return value
-    
-    if isinstance(value, int):
-        # Assume it's bytes if it's a large integer
-        if value > 1024:
-            return _format_bytes(value)
-        else:
-            return f"{value:,}"
-    
+        return _format_bytes(num_bytes) if num_bytes > 1024 else f"{num_bytes:,}"
+
     return str(value)
 
 
@@ -176,9 +193,37 @@ def _format_bytes(num_bytes: int) -> str:
     """
     if num_bytes < 1024:
         return f"{num_bytes:,} bytes"
-    elif num_bytes < 1024 ** 2:
-        return f"{num_bytes / 1024:.1f} KB"
-    elif num_bytes < 1024 ** 3:
-        return f"{num_bytes / 1024 ** 2:.1f} MB"
-    else:
-        return f"{num_bytes / 1024 ** 3:.1f} GB" 
\ No newline at end of file
+
+    # Scale through the units so TB-sized files don't fall back to a
+    # five-digit GB figure
+    size = float(num_bytes)
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024.0
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024.0:.1f} TB"
+
+
+def _format_upper(value: Any) -> str:
+    """Uppercase string formatter (e.g. for format names)."""
+    return str(value).upper()
+
+
+def _format_duckdb_view(value: Any) -> str:
+    """Render a DuckDB view name as inline code."""
+    return f"`{value}`" if value else "N/A"
+
+
+# Field-specific formatter dispatch, built once at import instead of
+# allocating a dict of closures per format_metadata_for_display call
+_FIELD_FORMATTERS = {
+    "File Path": str,
+    "Path": str,
+    "Format": _format_upper,
+    "Total Rows": _format_number,
+    "Total Columns": _format_number,
+    "Columns": _format_number,
+    "Size": _format_size_if_bytes,
+    "Memory Usage": _format_size_if_bytes,
+    "DuckDB View": _format_duckdb_view,
+}
\ No newline at end of file
@@ -2,12 +2,86 @@
 Statistics formatting utilities for parqv views.
 """
 
-from typing import Any, Dict, List, Union
-
+import hashlib
+import math
+from collections import OrderedDict
+from itertools import islice
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 from rich.text import Text
 
 from .visualization import create_text_histogram, should_show_histogram
 
+# Formatting is a pure function of the stats dict; reselecting a column whose
+# stats haven't changed reuses the already-built lines
+_STATS_CACHE: "OrderedDict[tuple, List[Union[str, Text]]]" = OrderedDict()
+_STATS_CACHE_SIZE = 32
+
+
+def _key_token(value: Any) -> Any:
+    """Hashable token for one cache-key value, descending into dicts.
+
+    ndarrays need special handling: str() of a large array elides the
+    middle, so two different histogram payloads would otherwise collide
+    on the same key. A digest of the raw buffer keys the full content.
+    """
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return ("ndarray", str(value.dtype), value.shape, digest)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _key_token(v)) for k, v in value.items()))
+    return str(value)
+
+
+def _stats_cache_key(stats_data: Dict[str, Any]) -> Optional[Tuple]:
+    """Build a hashable key for a stats dict, or None if it can't be keyed."""
+    try:
+        return _key_token(stats_data)
+    except (TypeError, ValueError):
+        return None
+
+# Display order for calculated statistics, with a frozenset companion so
+# the "additional stats" pass gets O(1) membership checks
+_STATS_ORDER = (
+    "Total Count", "Valid Count", "Null Count", "Null Percentage",
+    "Distinct Count", "Distinct Values (Approx)",
+    "Min", "Max", "Mean", "Median (50%)", "StdDev", "Variance",
+    "True Count", "False Count",
+    "Value Counts",
+)
+_STATS_ORDER_SET = frozenset(_STATS_ORDER)
+
+# Sentinel distinguishing "key absent" from a legitimate None value
+_MISSING = object()
+
+# Upper bound on Value Counts entries rendered per column; high-cardinality
+# columns get the top entries plus a truncation note instead of one line each
+_MAX_VALUE_COUNTS = 20
+
+# Precomposed label prefixes: Text.assemble tokenizes and allocates spans on
+# every call, so build each label once and copy()+append() the dynamic part
+_COLUMN_LABEL = Text.assemble(("Column: ", "bold"))
+_TYPE_LABEL = Text.assemble(("Type:   ", "bold"))
+_INFO_PREFIX = Text("Info: ", style="italic cyan")
+_CALC_ERROR_LABEL = Text("Calculation Error:", style="bold red")
+_CALC_STATS_LABEL = Text("Calculated Statistics:", style="bold")
+_NO_DATA = Text.from_markup("[red]No statistics data available.[/red]")
+
+@lru_cache(maxsize=64)
+def _separator(length: int) -> str:
+    """Header separator line, cached per length across column reselects."""
+    return "─" * length
+
+
+# Exact-type dispatch for stat values: one dict probe on type(value)
+# instead of cascaded isinstance checks
+_STAT_FMT_BY_TYPE = {
+    int: lambda v: f"{v:,}",
+    float: lambda v: f"{v:,.4f}",
+}
+
 
 def format_stats_for_display(stats_data: Dict[str, Any]) -> List[Union[str, Text]]:
     """
@@ -20,8 +94,17 @@ def format_stats_for_display(stats_data: Dict[str, Any]) -> List[Union[str, Text
         List of formatted lines ready for display
     """
     if not stats_data:
-        return [Text.from_markup("[red]No statistics data available.[/red]")]
+        return [_NO_DATA]
+
+    cache_key = _stats_cache_key(stats_data)
+    if cache_key is not None:
+        cached = _STATS_CACHE.get(cache_key)
+        if cached is not None:
+            _STATS_CACHE.move_to_end(cache_key)
+            return cached
 
+    # Helpers append into this one list in place, so formatting a column
+    # allocates a single list rather than a throwaway list per section
     lines: List[Union[str, Text]] = []
 
     # Extract basic column information
@@ -30,22 +113,27 @@ def format_stats_for_display(stats_data: Dict[str, Any]) -> List[Union[str, Text
     nullable_val = stats_data.get("nullable")
 
     # Format column header
-    lines.extend(_format_column_header(col_name, col_type, nullable_val))
+    _format_column_header(lines, col_name, col_type, nullable_val)
 
     # Handle calculation errors
     calc_error = stats_data.get("error")
     if calc_error:
-        lines.extend(_format_error_section(calc_error))
+        _format_error_section(lines, calc_error)
 
     # Add informational messages
     message = stats_data.get("message")
     if message:
-        lines.extend(_format_message_section(message))
+        _format_message_section(lines, message)
 
     # Format calculated statistics
     calculated = stats_data.get("calculated")
     if calculated:
-        lines.extend(_format_calculated_stats(calculated, has_error=bool(calc_error)))
+        _format_calculated_stats(lines, calculated, has_error=bool(calc_error))
+
+    if cache_key is not None:
+        _STATS_CACHE[cache_key] = lines
+        while len(_STATS_CACHE) > _STATS_CACHE_SIZE:
+            _STATS_CACHE.popitem(last=False)
 
     return lines
 
@@ -62,11 +150,13 @@ def format_column_info(column_name: str, column_type: str, nullable: Any) -> Lis
     Returns:
         List of formatted lines for column info
     """
-    return _format_column_header(column_name, column_type, nullable)
+    lines: List[Union[str, Text]] = []
+    _format_column_header(lines, column_name, column_type, nullable)
+    return lines
 
 
-def _format_column_header(col_name: str, col_type: str, nullable_val: Any) -> List[Union[str, Text]]:
-    """Format the column header section."""
+def _format_column_header(lines: List[Union[str, Text]], col_name: str, col_type: str, nullable_val: Any) -> None:
+    """Append the column header section to `lines`."""
     # Determine nullability display
     if nullable_val is True:
         nullable_str = "Nullable"
@@ -75,58 +165,47 @@ def _format_column_header(col_name: str, col_type: str, nullable_val: Any) -> Li
     else:
         nullable_str = "Unknown Nullability"
 
-    lines = [
-        Text.assemble(("Column: ", "bold"), f"`{col_name}`"),
-        Text.assemble(("Type:   ", "bold"), f"{col_type} ({nullable_str})"),
-        "─" * (len(col_name) + len(col_type) + 20)
-    ]
-
-    return lines
-
+    column_line = _COLUMN_LABEL.copy()
+    column_line.append(f"`{col_name}`")
+    type_line = _TYPE_LABEL.copy()
+    type_line.append(f"{col_type} ({nullable_str})")
+    lines.append(column_line)
+    lines.append(type_line)
+    lines.append(_separator(len(col_name) + len(col_type) + 20))
 
-def _format_error_section(calc_error: str) -> List[Union[str, Text]]:
-    """Format the error section."""
-    return [
-        Text("Calculation Error:", style="bold red"),
-        f"```\n{calc_error}\n```",
-        ""
-    ]
 
+def _format_error_section(lines: List[Union[str, Text]], calc_error: str) -> None:
+    """Append the error section to `lines`."""
+    lines.append(_CALC_ERROR_LABEL)
+    lines.append(f"```\n{calc_error}\n```")
+    lines.append("")
 
-def _format_message_section(message: str) -> List[Union[str, Text]]:
-    """Format the informational message section."""
-    return [
-        Text(f"Info: {message}", style="italic cyan"),
-        ""
-    ]
 
+def _format_message_section(lines: List[Union[str, Text]], message: str) -> None:
+    """Append the informational message section to `lines`."""
+    info_line = _INFO_PREFIX.copy()
+    info_line.append(message)
+    lines.append(info_line)
+    lines.append("")
 
-def _format_calculated_stats(calculated: Dict[str, Any], has_error: bool = False) -> List[Union[str, Text]]:
-    """Format the calculated statistics section."""
-    lines = [Text("Calculated Statistics:", style="bold")]
 
-    # Define the order of statistics to display
-    stats_order = [
-        "Total Count", "Valid Count", "Null Count", "Null Percentage",
-        "Distinct Count", "Distinct Values (Approx)",
-        "Min", "Max", "Mean", "Median (50%)", "StdDev", "Variance",
-        "True Count", "False Count",
-        "Value Counts"
-    ]
+def _format_calculated_stats(lines: List[Union[str, Text]], calculated: Dict[str, Any], has_error: bool = False) -> None:
+    """Append the calculated statistics section to `lines`."""
+    lines.append(_CALC_STATS_LABEL)
 
     found_stats = False
 
-    for key in stats_order:
-        if key in calculated:
+    for key in _STATS_ORDER:
+        value = calculated.get(key, _MISSING)
+        if value is not _MISSING:
             found_stats = True
-            value = calculated[key]
-            lines.extend(_format_single_stat(key, value))
+            _format_single_stat(lines, key, value)
 
     # Add any additional stats not in the predefined order (excluding internal histogram data)
     for key, value in calculated.items():
-        if key not in stats_order and not key.startswith('_'):  # Skip internal fields
+        if key not in _STATS_ORDER_SET and not key.startswith('_'):  # Skip internal fields
             found_stats = True
-            lines.extend(_format_single_stat(key, value))
+            _format_single_stat(lines, key, value)
 
     # Handle case where no stats were found
     if not found_stats and not has_error:
@@ -135,54 +214,62 @@ def _format_calculated_stats(calculated: Dict[str, Any], has_error: bool = False
     # Add histogram visualization for numeric data
     if "_histogram_data" in calculated and "_data_type" in calculated:
         if calculated["_data_type"] == "numeric":
-            lines.extend(_format_histogram_visualization(calculated))
-
-    return lines
-
+            _format_histogram_visualization(lines, calculated)
 
-def _format_single_stat(key: str, value: Any) -> List[Union[str, Text]]:
-    """Format a single statistic entry."""
-    lines = []
 
+def _format_single_stat(lines: List[Union[str, Text]], key: str, value: Any) -> None:
+    """Append a single statistic entry to `lines`."""
     if key == "Value Counts" and isinstance(value, dict):
         lines.append(f"  - {key}:")
-        for sub_key, sub_val in value.items():
+        for sub_key, sub_val in islice(value.items(), _MAX_VALUE_COUNTS):
             sub_val_str = _format_stat_value(sub_val)
             lines.append(f"    - {sub_key}: {sub_val_str}")
+        if len(value) > _MAX_VALUE_COUNTS:
+            lines.append(
+                Text(f"    (… {len(value) - _MAX_VALUE_COUNTS:,} more values truncated)", style="dim")
+            )
     else:
         formatted_value = _format_stat_value(value)
         lines.append(f"  - {key}: {formatted_value}")
 
-    return lines
-
 
 def _format_stat_value(value: Any) -> str:
     """Format a single statistic value."""
-    if isinstance(value, (int, float)):
-        if isinstance(value, int):
-            return f"{value:,}"
-        else:
-            return f"{value:,.4f}"
-    else:
-        return str(value)
+    formatter = _STAT_FMT_BY_TYPE.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    return str(value)
+
 
+def _parse_stat_bound(value: Any) -> Optional[float]:
+    """Parse a Min/Max stat (raw number or formatted string) into a float."""
+    try:
+        parsed = float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+    return parsed if math.isfinite(parsed) else None
 
-def _format_histogram_visualization(calculated: Dict[str, Any]) -> List[Union[str, Text]]:
-    """Format histogram visualization for numeric data."""
-    lines = []
 
+def _format_histogram_visualization(lines: List[Union[str, Text]], calculated: Dict[str, Any]) -> None:
+    """Append histogram visualization for numeric data to `lines`."""
     try:
-        histogram_data = calculated.get("_histogram_data", [])
-        if not histogram_data:
-            return lines
-
-        # Check if we should show histogram
-        distinct_count_str = calculated.get("Distinct Count", "0")
-        try:
-            # Remove commas and convert to int
-            distinct_count = int(distinct_count_str.replace(",", ""))
-        except (ValueError, AttributeError):
-            distinct_count = len(set(histogram_data))
+        histogram_data = calculated.get("_histogram_data")
+        if histogram_data is None or len(histogram_data) == 0:
+            return
+
+        # Check if we should show histogram; prefer the integer the handler
+        # computed over re-parsing its formatted string
+        distinct_count = calculated.get("_distinct_count_int")
+        if distinct_count is None:
+            distinct_count_str = calculated.get("Distinct Count", "0")
+            try:
+                # Remove commas and convert to int
+                distinct_count = int(distinct_count_str.replace(",", ""))
+            except (ValueError, AttributeError):
+                if isinstance(histogram_data, np.ndarray):
+                    distinct_count = len(np.unique(histogram_data))
+                else:
+                    distinct_count = len(set(histogram_data))
 
         total_count = len(histogram_data)
 
@@ -190,13 +277,22 @@ def _format_histogram_visualization(calculated: Dict[str, Any]) -> List[Union[st
             lines.append("")
             lines.append(Text("Data Distribution:", style="bold cyan"))
 
+            # The handler already computed Min/Max over the full column;
+            # feeding them in lets the histogram skip its own min/max pass
+            min_bound = _parse_stat_bound(calculated.get("Min"))
+            max_bound = _parse_stat_bound(calculated.get("Max"))
+            value_range = None
+            if min_bound is not None and max_bound is not None and min_bound < max_bound:
+                value_range = (min_bound, max_bound)
+
             # Create histogram
             histogram_lines = create_text_histogram(
                 data=histogram_data,
                 bins=15,
                 width=50,
                 height=8,
-                title=None
+                title=None,
+                value_range=value_range,
             )
 
             # Add each histogram line
@@ -216,5 +312,3 @@ def _format_histogram_visualization(calculated: Dict[str, Any]) -> List[Union[st
         # Don't fail the whole stats display if histogram fails
         lines.append("")
         lines.append(Text(f"Note: Could not generate histogram: {e}", style="dim red"))
-
-    return lines